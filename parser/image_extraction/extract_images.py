@@ -14,19 +14,64 @@ Usage:
 """
 
 import argparse
+import functools
+import io
 import json
 import os
 import re
 import shutil
 import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Load environment variables from .env file
 load_dotenv()
 
+# Leading-initial patterns used when generating alternate unit names
+_RE_LEAD_INITIALS = re.compile(r'^[A-Z]{1,2}[-\s]')  # "DM Gregg", "J-Smith"
+_RE_INIT_SPLIT = re.compile(r'^([A-Z]\.)+\s+(.+)$')  # "D.R. Jones" -> "Jones"
+
+# Period removal plus slash/space -> hyphen for RTG2-style image names
+_RTG2_TRANS = str.maketrans({'.': None, '/': '-', ' ': '-'})
+
+# First characters of names that can be an "Art Res-" / "Wagon Train" special case
+_RTG2_SPECIAL_FIRST = frozenset('AWw.')
+
+# Known non-unit HCR images, matched anywhere in the filename
+_HCR_EXCLUDE_SUBSTRINGS = (
+    'Fort', 'Balt', 'Boton', 'VP', 'Marker', 'Ammu', 'Ace', 'Chart',
+    'Control', 'CSA', 'USA', 'Destroyed', 'END', 'Falls', 'FORRAJEO',
+    'Gasme', 'HCR', 'Indestructible', 'Inteli', 'Detroyed', 'Cigars',
+    'Commitmen', 'DC-N', 'PA-N', 'RR-N', 'RR_', 'Shen-N', 'Map-',
+    'mmm-', 'Nigth-', 'OOA', 'Rain', 'Slow-', 'Snake', 'Start',
+    'Surrender', 'Time-', 'LEADER-master', 'Miayor-', 'Miinor-',
+    'pleasontonL', 'PleasontonLd',  # These are duplicates
+)
+# Corps designation counters (strength/quality), matched at the start
+_HCR_EXCLUDE_PREFIXES = (
+    r'^[A-Z]+-\d+-\d+',  # e.g., "J-2-0", "L-3-1"
+    r'^[IVX]+-P-',  # e.g., "I-P-1-0", "XII-P-2-3"
+    r'^[A-Z]+Sub-',  # e.g., "JSub-2-0", "LLSub-J"
+    r'^T\d+$',  # e.g., "T0", "T1"
+    r'^S_\d+_\d+$',  # e.g., "S_2_1"
+)
+_HCR_EXCLUDE = re.compile('|'.join([re.escape(s) for s in _HCR_EXCLUDE_SUBSTRINGS] + list(_HCR_EXCLUDE_PREFIXES)))
+
+# Known non-unit images left out of the "unused images" report
+_UNUSED_SKIP = re.compile('Sub|VP|Losses|Corp|Minor|WH-Lee|Shen')
+
+# Command suffixes VASSAL appends to some leader images (e.g., "MeadeAP")
+_LDR_SUFFIXES = ('AP', 'ANV', 'I', 'II', 'III', 'IV', 'V', 'VI', 'XI', 'XII', 'Cav', '1st', '2nd', '3rd')
+
 
 @dataclass
 class ImageMatch:
@@ -44,8 +89,13 @@ class ImageMatch:
 class GameExtractor:
     """Base class for game-specific image extraction."""
     
-    def get_available_images(self, images_dir: Path) -> dict[str, Path]:
-        """Get available images for this game. Override in subclasses."""
+    def get_available_images(self, images_dir: Path) -> tuple[dict[str, Path], dict[str, str]]:
+        """
+        Get available images for this game. Override in subclasses.
+        
+        Returns:
+            Tuple of (paths, filenames) dicts keyed by image basename
+        """
         raise NotImplementedError
     
     def find_image_match(self, unit_leader: str, side: str, unit_type: str, available_set: set[str]) -> str | None:
@@ -56,7 +106,8 @@ class GameExtractor:
 class RTG2Extractor(GameExtractor):
     """Extractor for RTG2 and similar games (OTR2, GTC2, HSN, RWH) using C_/U_ prefix convention."""
     
-    def normalize_unit_name(self, name: str) -> str:
+    @staticmethod
+    def normalize_unit_name(name: str) -> str:
         """
         Normalize a unit name for matching against VASSAL image filenames.
         
@@ -69,30 +120,31 @@ class RTG2Extractor(GameExtractor):
         - "1 NY/12 PA" -> "1-NY-12-PA"
         - "17 VA" -> "17VA" (space removed)
         """
-        # Remove periods
-        name = name.replace('.', '')
-        
-        # Handle special cases for artillery reserves
-        if name.startswith('Art Res-'):
-            num = name.split('-')[-1]
-            return f"Art{num}"
-        
-        # Handle wagon train and other special units
-        if name.lower() in ['wagon train']:
-            return None  # No image expected
-        
-        # Replace slashes with hyphens
-        name = name.replace('/', '-')
-        
-        # Replace spaces with hyphens
-        return name.replace(' ', '-')
-    def get_alternate_names(self, name: str) -> list[str]:
-        """Generate alternate name variations to try matching."""
+        # Special cases first; only names that can spell one are period-stripped
+        if name[:1] in _RTG2_SPECIAL_FIRST:
+            stripped = name.replace('.', '')
+
+            # Handle special cases for artillery reserves
+            if stripped.startswith('Art Res-'):
+                num = stripped.split('-')[-1]
+                return f"Art{num}"
+
+            # Handle wagon train and other special units
+            if stripped.lower() == 'wagon train':
+                return None  # No image expected
+
+        # Remove periods, replace slashes and spaces with hyphens (one pass)
+        return name.translate(_RTG2_TRANS)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_alternate_names(name: str) -> tuple[str, ...]:
+        """Generate alternate name variations to try matching (cached per name)."""
         variations = []
         
-        base = self.normalize_unit_name(name)
+        base = RTG2Extractor.normalize_unit_name(name)
         if base is None:
-            return []
+            return ()
         
         variations.append(base)
         
@@ -115,32 +167,38 @@ class RTG2Extractor(GameExtractor):
             variations.append(base.replace('Sykes', 'Siykes'))
         
         # Handle "DM Gregg" -> "Gregg" (strip leading initials for leaders)
-        if re.match(r'^[A-Z]{1,2}[-\s]', name):
-            stripped = re.sub(r'^[A-Z]{1,2}[-\s]', '', name)
-            stripped_norm = self.normalize_unit_name(stripped)
+        if _RE_LEAD_INITIALS.match(name):
+            stripped = _RE_LEAD_INITIALS.sub('', name)
+            stripped_norm = RTG2Extractor.normalize_unit_name(stripped)
             if stripped_norm:
                 variations.append(stripped_norm)
                 if 'Gregg' in stripped_norm:
                     variations.append(stripped_norm.replace('Gregg', 'Greg'))
         
-        return variations
+        # Drop duplicates (e.g. names without hyphens), keeping order
+        return tuple(dict.fromkeys(variations))
     
-    def get_available_images(self, images_dir: Path) -> dict[str, Path]:
+    def get_available_images(self, images_dir: Path) -> tuple[dict[str, Path], dict[str, str]]:
         """Get available images for RTG2-style games (C_/U_ prefix convention)."""
         images = {}
+        filenames = {}
         prefixes = ('C_', 'U_', 'CL_', 'UL_')
         extensions = ('.jpg', '.gif')
         
-        for f in images_dir.iterdir():
-            if f.suffix.lower() in extensions and f.name.startswith(prefixes):
-                # Skip _d depleted versions
-                if '_d.' in f.name:
-                    continue
-                base_name = f.stem
-                # Prefer .jpg over .gif if both exist
-                if base_name not in images or f.suffix.lower() == '.jpg':
-                    images[base_name] = f
-        return images
+        with os.scandir(images_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                lower = name.lower()
+                if lower.endswith(extensions) and name.startswith(prefixes):
+                    # Skip _d depleted versions
+                    if '_d.' in name:
+                        continue
+                    base_name = name[:-4]
+                    # Prefer .jpg over .gif if both exist
+                    if base_name not in images or lower.endswith('.jpg'):
+                        images[base_name] = Path(entry.path)
+                        filenames[base_name] = name
+        return images, filenames
     
     def find_image_match(self, unit_leader: str, side: str, unit_type: str, available_set: set[str]) -> str | None:
         """Find matching image using C_/U_ prefix convention."""
@@ -150,26 +208,58 @@ class RTG2Extractor(GameExtractor):
         else:
             prefix = 'C_' if side == 'Confederate' else 'U_'
         
-        for variation in self.get_alternate_names(unit_leader):
+        # Fast path: most names match after plain normalization
+        base = self.normalize_unit_name(unit_leader)
+        if base is not None:
+            candidate = f"{prefix}{base}"
+            if candidate in available_set:
+                return candidate
+        
+        variations = self.get_alternate_names(unit_leader)
+        for variation in variations:
             candidate = f"{prefix}{variation}"
             if candidate in available_set:
                 return candidate
         
         # For leaders, also try with command suffix (e.g., MeadeAP)
         if unit_type == 'Ldr':
-            for variation in self.get_alternate_names(unit_leader):
-                for suffix in ['AP', 'ANV', 'I', 'II', 'III', 'IV', 'V', 'VI', 'XI', 'XII', 'Cav', '1st', '2nd', '3rd']:
-                    candidate = f"{prefix}{variation}{suffix}"
-                    if candidate in available_set:
-                        return candidate
+            index = self.leader_suffix_index(available_set)
+            for variation in variations:
+                hits = index.get(f"{prefix}{variation}")
+                if hits:
+                    return hits[0]
         
         return None
+    
+    def leader_suffix_index(self, available_set: set[str]) -> dict[str, list[str]]:
+        """
+        Index leader images by their name with the command suffix removed.
+        
+        Maps e.g. "UL_Meade" -> ["UL_MeadeAP"], ordered by _LDR_SUFFIXES
+        priority. Built once per available_set and reused across units.
+        """
+        cached = getattr(self, '_suffix_index', None)
+        if cached is not None and cached[0] is available_set:
+            return cached[1]
+        
+        ranked = {}
+        for img in available_set:
+            if not img.startswith(('CL_', 'UL_')):
+                continue
+            for rank, suffix in enumerate(_LDR_SUFFIXES):
+                if img.endswith(suffix):
+                    ranked.setdefault(img[:-len(suffix)], []).append((rank, img))
+        index = {root: [img for _, img in sorted(hits)] for root, hits in ranked.items()}
+        
+        self._suffix_index = (available_set, index)
+        return index
 
 
 class HCRExtractor(GameExtractor):
     """Extractor for HCR using plain name convention (no prefixes)."""
     
-    def normalize_unit_name(self, name: str) -> str:
+    @staticmethod
+    def normalize_unit_name(name: str) -> str:
         """
         Normalize unit name for HCR.
         
@@ -180,18 +270,20 @@ class HCRExtractor(GameExtractor):
         name = name.replace('.', '')
         
         # Handle special units with no images
-        if name.lower() in ['wagon train']:
+        if name.lower() == 'wagon train':
             return None
         
         return name
     
-    def get_alternate_names(self, name: str) -> list[str]:
-        """Generate alternate name variations for HCR."""
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_alternate_names(name: str) -> tuple[str, ...]:
+        """Generate alternate name variations for HCR (cached per name)."""
         variations = []
         
-        base = self.normalize_unit_name(name)
+        base = HCRExtractor.normalize_unit_name(name)
         if base is None:
-            return []
+            return ()
         
         # Try as-is
         variations.append(base)
@@ -213,82 +305,72 @@ class HCRExtractor(GameExtractor):
             with_underscore = base.replace('-', '_').lower()
             variations.append(with_underscore)
         
+        initials = _count_leading_initials(name)
+        
         # Strip leading initials: "A.P. Hill" -> "Hill"
-        if re.match(r'^[A-Z]\.', name):
-            stripped = re.sub(r'^[A-Z]\.\s*', '', name)
+        if initials >= 1:
+            stripped = name[2:].lstrip()
             if stripped:
                 variations.append(stripped)
                 variations.append(stripped.capitalize())
         
         # Strip two-letter initials: "D.H. Hill" -> "Hill"
-        if re.match(r'^[A-Z]\.[A-Z]\.', name):
-            stripped = re.sub(r'^[A-Z]\.[A-Z]\.\s*', '', name)
+        if initials >= 2:
+            stripped = name[4:].lstrip()
             if stripped:
                 variations.append(stripped)
                 variations.append(stripped.capitalize())
         
         # Strip initials with space: "D.R. Jones" -> "Jones"
-        match = re.match(r'^([A-Z]\.)+\s+(.+)$', name)
-        if match:
-            last_name = match.group(2)
-            variations.append(last_name)
-            variations.append(last_name.capitalize())
-        
-        return variations
-    
-    def get_available_images(self, images_dir: Path) -> dict[str, Path]:
+        if initials and name[2 * initials:2 * initials + 1].isspace():
+            last_name = name[2 * initials:].lstrip()
+            if not last_name or '\n' in last_name:
+                # Unusual whitespace; defer to the regex for exact semantics
+                match = _RE_INIT_SPLIT.match(name)
+                last_name = match.group(2) if match else None
+            if last_name:
+                variations.append(last_name)
+                variations.append(last_name.capitalize())
+        
+        # Drop duplicates (e.g. names without hyphens), keeping order
+        return tuple(dict.fromkeys(variations))
+    
+    def get_available_images(self, images_dir: Path) -> tuple[dict[str, Path], dict[str, str]]:
         """Get available images for HCR (no prefix requirement)."""
         images = {}
+        filenames = {}
         extensions = ('.jpg', '.gif')
         
-        # Exclude known non-unit image patterns
-        exclude_patterns = [
-            'Fort', 'Balt', 'Boton', 'VP', 'Marker', 'Ammu', 'Ace', 'Chart',
-            'Control', 'CSA', 'USA', 'Destroyed', 'END', 'Falls', 'FORRAJEO',
-            'Gasme', 'HCR', 'Indestructible', 'Inteli', 'Detroyed', 'Cigars',
-            'Commitmen', 'DC-N', 'PA-N', 'RR-N', 'RR_', 'Shen-N', 'Map-',
-            'mmm-', 'Nigth-', 'OOA', 'Rain', 'Slow-', 'Snake', 'Start',
-            'Surrender', 'Time-', 'LEADER-master', 'Miayor-', 'Miinor-',
-            'pleasontonL', 'PleasontonLd',  # These are duplicates
-            # Corps designation counters (strength/quality)
-            re.compile(r'^[A-Z]+-\d+-\d+'),  # e.g., "J-2-0", "L-3-1"
-            re.compile(r'^[IVX]+-P-'),  # e.g., "I-P-1-0", "XII-P-2-3"
-            re.compile(r'^[A-Z]+Sub-'),  # e.g., "JSub-2-0", "LLSub-J"
-            re.compile(r'^T\d+$'),  # e.g., "T0", "T1"
-            re.compile(r'^S_\d+_\d+$'),  # e.g., "S_2_1"
-        ]
-        
-        for f in images_dir.iterdir():
-            if f.suffix.lower() not in extensions:
-                continue
-            
-            # Skip depleted versions
-            if '_d.' in f.name:
-                continue
-            
-            # Check if file should be excluded
-            should_exclude = False
-            for pattern in exclude_patterns:
-                if isinstance(pattern, re.Pattern):
-                    if pattern.match(f.name):
-                        should_exclude = True
-                        break
-                elif pattern in f.name:
-                    should_exclude = True
-                    break
-            
-            if should_exclude:
-                continue
-            
-            base_name = f.stem
-            # Prefer .jpg over .gif if both exist
-            if base_name not in images or f.suffix.lower() == '.jpg':
-                images[base_name] = f
+        with os.scandir(images_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                lower = name.lower()
+                if not lower.endswith(extensions):
+                    continue
+                
+                # Skip depleted versions
+                if '_d.' in name:
+                    continue
+                
+                # Exclude known non-unit image patterns
+                if _HCR_EXCLUDE.search(name):
+                    continue
+                
+                base_name = name[:-4]
+                # Prefer .jpg over .gif if both exist
+                if base_name not in images or lower.endswith('.jpg'):
+                    images[base_name] = Path(entry.path)
+                    filenames[base_name] = name
         
-        return images
+        return images, filenames
     
     def find_image_match(self, unit_leader: str, side: str, unit_type: str, available_set: set[str]) -> str | None:
         """Find matching image using plain name convention."""
+        # Fast path: most names match after plain normalization
+        base = self.normalize_unit_name(unit_leader)
+        if base is not None and base in available_set:
+            return base
+        
         for variation in self.get_alternate_names(unit_leader):
             if variation in available_set:
                 return variation
@@ -296,6 +378,14 @@ class HCRExtractor(GameExtractor):
         return None
 
 
+def _count_leading_initials(name: str) -> int:
+    """Count leading "X." initials (X in A-Z), e.g. 2 for "D.H. Hill"."""
+    count = 0
+    while len(name) >= 2 * count + 2 and 'A' <= name[2 * count] <= 'Z' and name[2 * count + 1] == '.':
+        count += 1
+    return count
+
+
 def get_extractor(game: str) -> GameExtractor:
     """Get the appropriate extractor for a game."""
     if game.lower() == 'hcr':
@@ -305,17 +395,23 @@ def get_extractor(game: str) -> GameExtractor:
         return RTG2Extractor()
 
 
+@functools.lru_cache(maxsize=8)
 def load_parsed_units(game: str) -> tuple[dict[str, str], dict[str, str]]:
     """
     Load unique unit leaders from a parsed game file.
     
+    Results are cached per game; treat the returned dicts as read-only.
+    
     Returns:
         Tuple of (confederate_units, union_units) dicts mapping unit_leader -> unit_type
     """
     parsed_file = Path(__file__).parent / 'parsed' / f'{game}_parsed.json'
     
-    with open(parsed_file) as f:
-        data = json.load(f)
+    if HAS_ORJSON:
+        data = orjson.loads(parsed_file.read_bytes())
+    else:
+        with open(parsed_file, encoding='utf-8') as f:
+            data = json.load(f)
     
     confederate = {}
     union = {}
@@ -395,9 +491,11 @@ def find_images_directory(source: Path, game: str) -> Path:
 
 
 def extract_vmod(vmod_path: Path, temp_dir: Path) -> Path:
-    """Extract a .vmod file and return the path to the images directory."""
+    """Extract the images from a .vmod file and return the path to the images directory."""
     with zipfile.ZipFile(vmod_path, 'r') as z:
-        z.extractall(temp_dir)
+        # Skip buildFile, sounds, etc. - only the images are used
+        members = [n for n in z.namelist() if n.startswith('images/')]
+        z.extractall(temp_dir, members=members)
     
     images_dir = temp_dir / 'images'
     if not images_dir.exists():
@@ -406,8 +504,8 @@ def extract_vmod(vmod_path: Path, temp_dir: Path) -> Path:
     return images_dir
 
 
-def get_available_images(images_dir: Path, game: str) -> dict[str, Path]:
-    """Get a dict of available images using game-specific extractor."""
+def get_available_images(images_dir: Path, game: str) -> tuple[dict[str, Path], dict[str, str]]:
+    """Get (paths, filenames) dicts of available images using game-specific extractor."""
     extractor = get_extractor(game)
     return extractor.get_available_images(images_dir)
 
@@ -423,7 +521,7 @@ def build_mapping(game: str, images_dir: Path) -> dict:
     """
     extractor = get_extractor(game)
     confederate_units, union_units = load_parsed_units(game)
-    available_images = get_available_images(images_dir, game)
+    available_images, image_filenames = get_available_images(images_dir, game)
     available_set = set(available_images.keys())
     
     matched = {}
@@ -432,36 +530,31 @@ def build_mapping(game: str, images_dir: Path) -> dict:
     used_images = set()
     
     # Match Confederate units
-    for unit, unit_type in sorted(confederate_units.items()):
+    for unit in sorted(confederate_units):
+        unit_type = confederate_units[unit]
         img = extractor.find_image_match(unit, 'Confederate', unit_type, available_set)
         if img:
             matched[f"C:{unit}"] = img
             # Get the actual filename with extension
-            img_path = available_images[img]
-            matched_with_ext[f"C:{unit}"] = img_path.name
+            matched_with_ext[f"C:{unit}"] = image_filenames[img]
             used_images.add(img)
         else:
             unmatched.append(f"Confederate ({unit_type}): {unit}")
     
     # Match Union units
-    for unit, unit_type in sorted(union_units.items()):
+    for unit in sorted(union_units):
+        unit_type = union_units[unit]
         img = extractor.find_image_match(unit, 'Union', unit_type, available_set)
         if img:
             matched[f"U:{unit}"] = img
             # Get the actual filename with extension
-            img_path = available_images[img]
-            matched_with_ext[f"U:{unit}"] = img_path.name
+            matched_with_ext[f"U:{unit}"] = image_filenames[img]
             used_images.add(img)
         else:
             unmatched.append(f"Union ({unit_type}): {unit}")
     
     # Find unused images (excluding markers, VPs, etc.)
-    unused = []
-    for img_name in sorted(available_set - used_images):
-        # Skip known non-unit images
-        if any(x in img_name for x in ['Sub', 'VP', 'Losses', 'Corp', 'Minor', 'WH-Lee', 'Shen']):
-            continue
-        unused.append(img_name)
+    unused = sorted(img for img in available_set - used_images if not _UNUSED_SKIP.search(img))
     
     return {
         'matched': matched,
@@ -485,83 +578,75 @@ def copy_images(mapping: dict, output_dir: Path, include_depleted: bool = False)
     
     image_paths = mapping['image_paths']
     copied = 0
+    jobs = {}  # dst -> src; several units can share one image
+    dir_listings = {}
     
     for unit_key, img_name in mapping['matched'].items():
         if img_name in image_paths:
             src = image_paths[img_name]
-            dst = output_dir / src.name
-            shutil.copy2(src, dst)
+            jobs[output_dir / src.name] = src
             copied += 1
             
             # Also copy depleted version if requested
             if include_depleted:
                 depleted_name = f"{img_name}_d.gif"
-                depleted_src = src.parent / depleted_name
-                if depleted_src.exists():
-                    shutil.copy2(depleted_src, output_dir / depleted_name)
+                if src.parent not in dir_listings:
+                    dir_listings[src.parent] = set(os.listdir(src.parent))
+                if depleted_name in dir_listings[src.parent]:
+                    jobs[output_dir / depleted_name] = src.parent / depleted_name
+    
+    # Copies are I/O bound, so overlap them on a small thread pool
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(shutil.copy2, jobs.values(), jobs.keys()))
     
     return copied
 
 
 def generate_typescript_map(game: str, matched_with_ext: dict, ts_file: Path):
     """
-    Generate or update the TypeScript image mapping file.
+    Generate the TypeScript image mapping file.
     
     The file exports a nested object: { game: { "side:unitName": "filename.jpg" } }
+    Units are written in matched_with_ext order, which build_mapping already
+    produces sorted by key.
     """
-    # Read existing file if it exists
-    existing_data = {}
-    if ts_file.exists():
-        content = ts_file.read_text()
-        # Try to extract existing data - simple regex approach
-        import re
-        # Match the imageMap object definition
-        match = re.search(r'export const imageMap[^=]*=\s*(\{[\s\S]*?\n\};)', content)
-        if match:
-            # We'll just regenerate the whole file to be safe
-            pass
-    
-    # Build the new data
-    existing_data[game] = matched_with_ext
-    
-    # Generate TypeScript content
-    lines = [
-        '// Auto-generated by extract_images.py - DO NOT EDIT MANUALLY',
-        '// Maps unit keys ("C:UnitName" or "U:UnitName") to image filenames',
-        '',
-        'export type ImageMap = Record<string, Record<string, string>>;',
-        '',
-        'export const imageMap: ImageMap = {',
-    ]
-    
-    for game_code in sorted(existing_data.keys()):
-        game_data = existing_data[game_code]
-        lines.append(f'  {game_code}: {{')
-        for unit_key in sorted(game_data.keys()):
-            filename = game_data[unit_key]
-            # Escape quotes in keys
-            safe_key = unit_key.replace('"', '\\"')
-            lines.append(f'    "{safe_key}": "{filename}",')
-        lines.append('  },')
-    
-    lines.append('};')
-    lines.append('')
-    lines.append('/**')
-    lines.append(' * Get the image filename for a unit.')
-    lines.append(' * @param game - Game code (e.g., "rtg2")')
-    lines.append(' * @param side - "confederate" or "union"')
-    lines.append(' * @param unitName - The unit leader/name field')
-    lines.append(' * @returns The image filename or undefined if not found')
-    lines.append(' */')
-    lines.append('export function getUnitImage(game: string, side: "confederate" | "union", unitName: string): string | undefined {')
-    lines.append('  const gameMap = imageMap[game];')
-    lines.append('  if (!gameMap) return undefined;')
-    lines.append('  const prefix = side === "confederate" ? "C" : "U";')
-    lines.append('  return gameMap[`${prefix}:${unitName}`];')
-    lines.append('}')
-    lines.append('')
-    
-    ts_file.write_text('\n'.join(lines))
+    # The whole file is regenerated from the current game's mapping
+    buf = io.StringIO()
+    w = buf.write
+    w('// Auto-generated by extract_images.py - DO NOT EDIT MANUALLY\n'
+      '// Maps unit keys ("C:UnitName" or "U:UnitName") to image filenames\n'
+      '\n'
+      'export type ImageMap = Record<string, Record<string, string>>;\n'
+      '\n'
+      'export const imageMap: ImageMap = {\n')
+    
+    w(f'  {game}: {{\n')
+    for unit_key, filename in matched_with_ext.items():
+        # Escape quotes in keys
+        w('    "')
+        w(unit_key.replace('"', '\\"'))
+        w('": "')
+        w(filename)
+        w('",\n')
+    w('  },\n')
+    
+    w('};\n'
+      '\n'
+      '/**\n'
+      ' * Get the image filename for a unit.\n'
+      ' * @param game - Game code (e.g., "rtg2")\n'
+      ' * @param side - "confederate" or "union"\n'
+      ' * @param unitName - The unit leader/name field\n'
+      ' * @returns The image filename or undefined if not found\n'
+      ' */\n'
+      'export function getUnitImage(game: string, side: "confederate" | "union", unitName: string): string | undefined {\n'
+      '  const gameMap = imageMap[game];\n'
+      '  if (!gameMap) return undefined;\n'
+      '  const prefix = side === "confederate" ? "C" : "U";\n'
+      '  return gameMap[`${prefix}:${unitName}`];\n'
+      '}\n')
+    
+    ts_file.write_text(buf.getvalue())
 
 
 def get_vassal_path(game_id: str) -> str | None:
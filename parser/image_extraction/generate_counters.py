@@ -13,12 +13,16 @@ Usage:
 """
 
 import argparse
+import contextlib
+import functools
+import itertools
 import json
 import os
 import re
 import shutil
 import tempfile
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Callable
@@ -34,6 +38,112 @@ except ImportError:
     HAS_PIL = False
     print("Warning: Pillow not installed. Run: uv add pillow")
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    from rapidfuzz import process as fuzz_process
+    from rapidfuzz.distance import Levenshtein
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
+
+# =============================================================================
+# Precompiled patterns
+# =============================================================================
+
+# buildFile.xml parsing
+_RE_PIECE_SLOT = re.compile(
+    r'<VASSAL\.build\.widget\.PieceSlot\s+entryName="([^"]+)"[^>]*>([^<]*)</VASSAL\.build\.widget\.PieceSlot>',
+    re.DOTALL,
+)
+_RE_PIECE_JPG = re.compile(r'piece;;;([^;]+\.jpg);[^/]+/', re.IGNORECASE)
+_RE_PIECE_IMAGE = re.compile(r'piece;;;([^;]+);[^/]+/')
+_RE_OTR2_PIECE = re.compile(r'piece;;;([A-Za-z0-9_-]+\.(?:jpg|gif));([^/]+)/')
+_RE_UNIT_PROTOTYPE = re.compile(r'prototype;(USA|CSA)\s+(Infantry|Cavalry)\s+(Division|Brigade|Regiment)')
+_RE_UNIT_PROTOTYPE_SUB = re.compile(r'prototype;(USA|CSA)\s+(Infantry|Cavalry)\s+(Division|Brigade|Regiment|Sub)')
+
+# Name variant generation
+_RE_SPACED_DASH_SUFFIX = re.compile(r'\s+-\s+([A-Z])$')  # "Hood - A"
+_RE_DIGIT_CAPS = re.compile(r'(\d)([A-Z]{2})')  # "5MD"
+_RE_DOT_CAPITAL = re.compile(r'\.([A-Z])')  # "A.P.Hill"
+_RE_INITIAL_DOT_SPACE = re.compile(r'^([A-Z]\.)\s')  # "F. Lee"
+_RE_INITIAL_DOT_CAPITAL = re.compile(r'^[A-Z]\.[A-Z]')  # "F.Lee"
+_RE_LEADING_INITIAL_DOT = re.compile(r'^([A-Z])\.')
+_RE_NUMBER_STATE = re.compile(r'^(\d+)([A-Z]{2,})$')  # "4PA"
+_RE_NUMBER_STATE_PAIR = re.compile(r'^(\d+)([A-Z]{2})$')  # "13PA"
+_RE_NUMBER_SPACE_STATE = re.compile(r'^\d+\s+[A-Z]{2}$')  # "13 PA"
+_RE_SLASH_PAIR = re.compile(r'(\d+)/(\d+)')  # "49/69"
+_RE_COMBINED_REGIMENT = re.compile(r'^\d+/\d+\s+[A-Z]{2}')  # "25/29 GA"
+_RE_IN_SUFFIX = re.compile(r'\s+IN$')
+_RE_DMNT = re.compile(r'\s*\(dmnt\)', re.IGNORECASE)
+_RE_DMT = re.compile(r'\s+dmt', re.IGNORECASE)
+_RE_CORPS_SUFFIX = re.compile(r'\s+(II|X|XVIII|XIX|XXIV|XXV|I|V|VI|IX)$')  # "Birney II"
+_RE_DASHED_CORPS_SUFFIX = re.compile(r'\s+-\s+(II|X|XVIII|XIX|XXIV|XXV|I|V|VI|IX)$')  # "Birney - II"
+_RE_ROMAN_SUFFIX = re.compile(r'\s+([IVX]+)$')
+_RE_DASHED_ROMAN_SUFFIX = re.compile(r'\s+-\s+([IVX]+)$')
+_RE_HYPHEN_ROMAN_SUFFIX = re.compile(r'-([IVX]+)$')  # "Birney-II"
+_RE_WHEATON_HYPHEN = re.compile(r'Wheaton-([A-Z])$')
+_RE_WHEATON_DASHED = re.compile(r'Wheaton - ([A-Z])$')
+_RE_ORDINAL_SUFFIX = re.compile(r'-\d+(st|nd|rd|th)$')  # "Devens-24th"
+_RE_NON_ALNUM = re.compile(r'[^a-z0-9]')
+
+
+def _substring_pattern(*needles: str) -> re.Pattern:
+    """Compile literal substrings into one alternation.
+
+    pattern.search(s) is true exactly when any(n in s for n in needles) is, so
+    glued entry names like "HancockII" still match "Hancock".
+    """
+    return re.compile('|'.join(map(re.escape, needles)))
+
+
+# Cheap prefix/suffix checks used by the variant generators. These cover the
+# single-character cases that don't need the regex engine.
+
+def _is_cap(c: str) -> bool:
+    return 'A' <= c <= 'Z'
+
+
+def _has_dash_suffix(name: str) -> bool:
+    """True for "Hood-A"."""
+    return len(name) >= 2 and name[-2] == '-' and _is_cap(name[-1])
+
+
+def _has_paren_suffix(name: str) -> bool:
+    """True for "Hood (A)"."""
+    return len(name) >= 3 and name[-1] == ')' and name[-3] == '(' and _is_cap(name[-2])
+
+
+def _has_one_initial(name: str) -> bool:
+    """True for "E Johnson"."""
+    return len(name) >= 2 and _is_cap(name[0]) and name[1].isspace()
+
+
+def _has_two_initials(name: str) -> bool:
+    """True for "WH Lee"."""
+    return len(name) >= 3 and _is_cap(name[0]) and _is_cap(name[1]) and name[2].isspace()
+
+
+def _has_three_caps(name: str) -> bool:
+    """True for "WHLee"."""
+    return len(name) >= 3 and _is_cap(name[0]) and _is_cap(name[1]) and _is_cap(name[2])
+
+
+def _has_spaced_initials(name: str) -> bool:
+    """True for "B R Johnson"."""
+    return (len(name) >= 4 and _is_cap(name[0]) and name[1].isspace()
+            and _is_cap(name[2]) and name[3].isspace())
+
+
+def _swap_variants(name: str, swaps: tuple[tuple[str, str], ...]) -> list[str]:
+    """Apply each (old, new) spelling swap whose old spelling occurs in name."""
+    return [name.replace(old, new) for old, new in swaps if old in name]
+
 
 # =============================================================================
 # Game-specific configurations
@@ -45,7 +155,7 @@ class GameConfig:
     game_id: str
     union_leaders: list[str] = field(default_factory=list)
     csa_leaders: list[str] = field(default_factory=list)
-    name_variants_fn: Callable[[str], list[str]] | None = None
+    name_variants_fn: Callable[[str], tuple[str, ...]] | None = None
     extract_mappings_fn: Callable[[Path], dict] | None = None
     skip_units: list[str] = field(default_factory=lambda: ['Wagon Train', 'Gunboat', 'Naval Battery'])
     # For combined regiments that need fallback backgrounds
@@ -55,11 +165,84 @@ class GameConfig:
 def base_normalize_name(name: str) -> str:
     """Basic name normalization shared across games."""
     name = ' '.join(name.split())
-    name = re.sub(r'\s+-\s+([A-Z])$', r'-\1', name)
+    name = _RE_SPACED_DASH_SUFFIX.sub(r'-\1', name)
     return name
 
 
-def base_get_name_variants(name: str) -> list[str]:
+def _canon(name: str) -> str:
+    """Canonical lookup key: lowercase with punctuation and spacing removed."""
+    return _RE_NON_ALNUM.sub('', name.lower())
+
+
+def _build_vassal_lookup(
+    mappings: dict,
+    get_variants: Callable[[str], tuple[str, ...]],
+) -> dict[str, tuple[dict, dict]]:
+    """Index every VASSAL name variant per side as (exact, canonical) dicts.
+
+    Units are added before leaders, so a unit keeps any key both claim.
+    """
+    vassal_lookup = {side: ({}, {}) for side in ('Union', 'Confederate')}
+    for side, (exact, canonical) in vassal_lookup.items():
+        leaders = ((name, {'image': img, 'type': 'Leader'})
+                   for name, img in mappings['Leaders'].get(side, {}).items())
+        for name, info in itertools.chain(mappings.get(side, {}).items(), leaders):
+            for variant in get_variants(name):
+                exact.setdefault(variant, info)
+                canonical.setdefault(_canon(variant), info)
+    return vassal_lookup
+
+
+def _find_vassal_info(
+    name: str,
+    get_variants: Callable[[str], tuple[str, ...]],
+    exact: dict,
+    canonical: dict,
+) -> dict | str | None:
+    """Look up a parsed name: exact variant keys first, canonical keys only on a miss.
+
+    Canonical keys merge entries that differ only in case or punctuation
+    ("Breckinridge@" vs "Breckinridge"), so they are a fallback, not the
+    primary index.
+    """
+    info = exact.get(name)
+    if info:
+        return info
+    variants = get_variants(name)
+    for variant in variants:
+        info = exact.get(variant)
+        if info:
+            return info
+    for variant in variants:
+        info = canonical.get(_canon(variant))
+        if info:
+            return info
+    return None
+
+
+FUZZY_SCORE_CUTOFF = 0.85
+
+
+def _fuzzy_key(key: str, candidates: list[str]) -> str | None:
+    """Closest canonical key by normalized Levenshtein similarity (needs rapidfuzz).
+
+    Candidates ending in a different character are rejected so that lettered
+    variants like "Ricketts-A" and "Ricketts-B" never stand in for each other.
+    """
+    if not key:
+        return None
+    result = fuzz_process.extractOne(
+        key, candidates,
+        scorer=Levenshtein.normalized_similarity,
+        score_cutoff=FUZZY_SCORE_CUTOFF,
+    )
+    if result and result[0][-1] == key[-1]:
+        return result[0]
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def base_get_name_variants(name: str) -> tuple[str, ...]:
     """Generate basic name variants for fuzzy matching."""
     variants = [name]
     
@@ -70,9 +253,9 @@ def base_get_name_variants(name: str) -> list[str]:
     # Handle " - A" vs "-A" style suffixes
     if ' - ' in name:
         variants.append(name.replace(' - ', '-'))
-    if re.search(r'-[A-Z]$', name):
-        variants.append(re.sub(r'-([A-Z])$', r' - \1', name))
-        base = re.sub(r'-[A-Z]$', '', name)
+    if _has_dash_suffix(name):
+        base = name[:-2]
+        variants.append(f"{base} - {name[-1]}")
         variants.append(base)
     
     # Handle space vs hyphen
@@ -81,70 +264,61 @@ def base_get_name_variants(name: str) -> list[str]:
     if '-' in name and ' ' not in name:
         variants.append(name.replace('-', ' '))
     
-    return list(set(variants))
+    return tuple(dict.fromkeys(variants))
 
 
 # -----------------------------------------------------------------------------
 # GTC2 Configuration
 # -----------------------------------------------------------------------------
 
-def gtc2_get_name_variants(name: str) -> list[str]:
+_GTC2_TYPO_SWAPS = (
+    ('Wilcox', 'Willcox'), ('Willcox', 'Wilcox'),
+    ('Torbert', 'Tobert'), ('Tobert', 'Torbert'),
+    ('Warren', 'Warrent'), ('Warrent', 'Warren'),
+    ('Schoonmaker', 'Schoonmkr'), ('Schoonmkr', 'Schoonmaker'),
+)
+
+@functools.lru_cache(maxsize=4096)
+def gtc2_get_name_variants(name: str) -> tuple[str, ...]:
     """Generate variants of a name for fuzzy matching (GTC2-specific)."""
-    variants = base_get_name_variants(name)
+    variants = list(base_get_name_variants(name))
     
     # Handle (B) vs -B suffix style
-    paren_match = re.search(r'\s*\(([A-Z])\)$', name)
-    if paren_match:
-        base = re.sub(r'\s*\([A-Z]\)$', '', name)
-        variants.append(f"{base}-{paren_match.group(1)}")
-    hyphen_match = re.search(r'-([A-Z])$', name)
-    if hyphen_match:
-        base = re.sub(r'-[A-Z]$', '', name)
-        variants.append(f"{base} ({hyphen_match.group(1)})")
+    if _has_paren_suffix(name):
+        base = name[:-3].rstrip()
+        variants.append(f"{base}-{name[-2]}")
+    if _has_dash_suffix(name):
+        base = name[:-2]
+        variants.append(f"{base} ({name[-1]})")
     
     # Handle "WH Lee" vs "WHLee" vs "WH-Lee"
-    if re.match(r'^[A-Z]{2}\s', name):
+    if _has_two_initials(name):
         base = name[2:].strip()
         variants.append(f"{name[0]}{name[1]}{base}")
         variants.append(f"{name[0]}{name[1]}-{base}")
-    if re.match(r'^[A-Z]{2}[A-Z]', name) and ' ' not in name[:4]:
+    if _has_three_caps(name) and ' ' not in name[:4]:
         variants.append(f"{name[0]}{name[1]} {name[2:]}")
     
     # Handle "DM Gregg" vs "DM-Gregg"
-    if re.match(r'^[A-Z]{2}\s', name):
+    if _has_two_initials(name):
         variants.append(name.replace(' ', '-', 1))
     
     # Handle "E Johnson" vs "E-Johnson" vs "EJohnson"
-    if re.match(r'^[A-Z]\s', name):
+    if _has_one_initial(name):
         base = name[2:]
         variants.append(f"{name[0]}-{base}")
         variants.append(f"{name[0]}{base}")
     
     # Handle "BR Johnson" vs "BR-Johnson" vs "B R Johnson"
-    if re.match(r'^[A-Z]{2}\s', name):
+    if _has_two_initials(name):
         base = name[3:]
         variants.append(f"{name[:2]}-{base}")
         variants.append(f"{name[0]} {name[1]} {base}")
-    if re.match(r'^[A-Z]\s[A-Z]\s', name):
+    if _has_spaced_initials(name):
         variants.append(f"{name[0]}{name[2]}{name[3:]}")
     
     # Typo handling
-    if 'Wilcox' in name:
-        variants.append(name.replace('Wilcox', 'Willcox'))
-    if 'Willcox' in name:
-        variants.append(name.replace('Willcox', 'Wilcox'))
-    if 'Torbert' in name:
-        variants.append(name.replace('Torbert', 'Tobert'))
-    if 'Tobert' in name:
-        variants.append(name.replace('Tobert', 'Torbert'))
-    if 'Warren' in name:
-        variants.append(name.replace('Warren', 'Warrent'))
-    if 'Warrent' in name:
-        variants.append(name.replace('Warrent', 'Warren'))
-    if 'Schoonmaker' in name:
-        variants.append(name.replace('Schoonmaker', 'Schoonmkr'))
-    if 'Schoonmkr' in name:
-        variants.append(name.replace('Schoonmkr', 'Schoonmaker'))
+    variants.extend(_swap_variants(name, _GTC2_TYPO_SWAPS))
     
     # Handle escaped slashes
     if '\\/' in name:
@@ -153,7 +327,7 @@ def gtc2_get_name_variants(name: str) -> list[str]:
         variants.append(name.replace('/', '\\/'))
         variants.append(name.replace(' / ', '/'))
         variants.append(name.replace('/', ' / '))
-        no_space = re.sub(r'(\d)([A-Z]{2})', r'\1 \2', name)
+        no_space = _RE_DIGIT_CAPS.sub(r'\1 \2', name)
         if no_space != name:
             variants.append(no_space)
     
@@ -182,7 +356,30 @@ def gtc2_get_name_variants(name: str) -> list[str]:
         variants.append(name.replace('Wash Art', 'Washington Art'))
         variants.append(name.replace('Wash Art', 'Washington Art.'))
     
-    return list(set(variants))
+    return tuple(dict.fromkeys(variants))
+
+
+_GTC2_ENTRY_SKIP = _substring_pattern(
+    'vp', 'ammu', 'bridge', 'wagon', 'command', 'control', 'track', 'paralysis',
+    'game-turn', 'cycle', 'defeat', 'supply', 'event', 'rain', 'heat', 'posture',
+    'mov', 'ope',
+)
+_GTC2_IMAGE_SKIP = _substring_pattern(
+    'vp', 'ammu', 'control', 'wagon', 'cp.', 'ctrl', 'bridge', 'losses', 'rr_',
+    'rr-', 'strong', 'weak', 'init', 'forces', 'display', 'chart', 'replacement',
+    'damage', 'destroyed', 'transport', 'start', 'end', 'map', 'tt-', 'strategic',
+)
+_GTC2_UNION_LEADERS = _substring_pattern(
+    'Grant', 'Hancock', 'Burnside', 'Butler', 'Crook', 'Sheridan', 'Wright', 'Warren',
+    'Sedgwick', 'Smith', 'Sigel', 'Hunter', 'Merritt', 'Averell', 'Kautz', 'Gillmore',
+    'Griffin', 'Humphreys', 'Terry', 'Torbert', 'Martindale', 'Wilson', 'Wilcox',
+    'DM Gregg', 'Upton', 'Merrit',
+)
+_GTC2_CSA_LEADERS = _substring_pattern(
+    'Lee', 'Longstreet', 'Ewell', 'Stuart', 'Anderson', 'Early', 'Hampton', 'Beauregard',
+    'Breckinridge', 'Hoke', 'Pickett', 'AP Hill', 'APHill', 'A.P. Hill', 'F Lee', 'WH Lee',
+    'WHLee', 'E Johnson', 'BR Johnson', 'WE Jones',
+)
 
 
 def gtc2_extract_unit_mappings(buildfile_path: Path) -> dict:
@@ -195,42 +392,25 @@ def gtc2_extract_unit_mappings(buildfile_path: Path) -> dict:
         "Leaders": {"Union": {}, "Confederate": {}}
     }
     
-    slot_pattern = r'<VASSAL\.build\.widget\.PieceSlot\s+entryName="([^"]+)"[^>]*>([^<]*)</VASSAL\.build\.widget\.PieceSlot>'
-    
-    for match in re.finditer(slot_pattern, content, re.DOTALL):
+    for match in _RE_PIECE_SLOT.finditer(content):
         entry_name = match.group(1)
         slot_content = match.group(2)
         
-        image_match = re.search(r'piece;;;([^;]+\.jpg);[^/]+/', slot_content, re.IGNORECASE)
+        image_match = _RE_PIECE_JPG.search(slot_content)
         if not image_match:
             continue
         image_file = image_match.group(1)
         
         # Skip markers and non-unit items
-        if any(skip in entry_name.lower() for skip in ['vp', 'ammu', 'bridge', 'wagon', 
-                'command', 'control', 'track', 'paralysis', 'game-turn', 'cycle', 'defeat',
-                'supply', 'event', 'rain', 'heat', 'posture', 'mov', 'ope']):
+        if _GTC2_ENTRY_SKIP.search(entry_name.lower()):
             continue
-        if any(skip in image_file.lower() for skip in ['vp', 'ammu', 'control', 'wagon',
-                'cp.', 'ctrl', 'bridge', 'losses', 'rr_', 'rr-', 'strong', 'weak', 'init',
-                'forces', 'display', 'chart', 'replacement', 'damage', 'destroyed',
-                'transport', 'start', 'end', 'map', 'tt-', 'strategic']):
+        if _GTC2_IMAGE_SKIP.search(image_file.lower()):
             continue
         
         if 'prototype;Leader' in slot_content:
-            union_leaders = ['Grant', 'Hancock', 'Burnside', 'Butler', 'Crook', 'Sheridan',
-                           'Wright', 'Warren', 'Sedgwick', 'Smith', 'Sigel', 'Hunter',
-                           'Merritt', 'Averell', 'Kautz', 'Gillmore', 'Griffin', 'Humphreys',
-                           'Terry', 'Torbert', 'Martindale', 'Wilson', 'Wilcox', 'DM Gregg',
-                           'Upton', 'Merrit']
-            csa_leaders = ['Lee', 'Longstreet', 'Ewell', 'Stuart', 'Anderson', 'Early',
-                          'Hampton', 'Beauregard', 'Breckinridge', 'Hoke', 'Pickett',
-                          'AP Hill', 'APHill', 'A.P. Hill', 'F Lee', 'WH Lee', 'WHLee',
-                          'E Johnson', 'BR Johnson', 'WE Jones']
-            
-            if any(leader in entry_name for leader in union_leaders):
+            if _GTC2_UNION_LEADERS.search(entry_name):
                 mappings["Leaders"]["Union"][entry_name] = image_file
-            elif any(leader in entry_name for leader in csa_leaders):
+            elif _GTC2_CSA_LEADERS.search(entry_name):
                 mappings["Leaders"]["Confederate"][entry_name] = image_file
             else:
                 if 'CL-' in image_file:
@@ -238,7 +418,7 @@ def gtc2_extract_unit_mappings(buildfile_path: Path) -> dict:
                 else:
                     mappings["Leaders"]["Union"][entry_name] = image_file
         else:
-            type_match = re.search(r'prototype;(USA|CSA)\s+(Infantry|Cavalry)\s+(Division|Brigade|Regiment)', slot_content)
+            type_match = _RE_UNIT_PROTOTYPE.search(slot_content)
             if type_match:
                 side = "Union" if type_match.group(1) == "USA" else "Confederate"
                 unit_type = f"{type_match.group(2)} {type_match.group(3)}"
@@ -261,12 +441,20 @@ GTC2_CONFIG = GameConfig(
 # HCR Configuration
 # -----------------------------------------------------------------------------
 
-def hcr_get_name_variants(name: str) -> list[str]:
+_HCR_TYPO_SWAPS = (
+    ('Heitz', 'Heintz'), ('Heintz', 'Heitz'),
+    ('Wilcox', 'Willcox'), ('Willcox', 'Wilcox'),
+    # Curly vs straight apostrophe (D’Utassy)
+    ('’', "'"), ("'", '’'),
+)
+
+@functools.lru_cache(maxsize=4096)
+def hcr_get_name_variants(name: str) -> tuple[str, ...]:
     """Generate variants of a name for fuzzy matching (HCR-specific)."""
-    variants = base_get_name_variants(name)
+    variants = list(base_get_name_variants(name))
     
     # Add version with periods followed by space: "A.P.Hill" -> "A.P. Hill"
-    spaced = re.sub(r'\.([A-Z])', r'. \1', name)
+    spaced = _RE_DOT_CAPITAL.sub(r'. \1', name)
     if spaced != name:
         variants.append(spaced)
     
@@ -275,29 +463,23 @@ def hcr_get_name_variants(name: str) -> list[str]:
         variants.append(name + suffix)
         variants.append(base_normalize_name(name) + suffix)
     
-    # Typo handling
-    if 'Heitz' in name:
-        variants.append(name.replace('Heitz', 'Heintz'))
-    if 'Heintz' in name:
-        variants.append(name.replace('Heintz', 'Heitz'))
-    if 'Wilcox' in name:
-        variants.append(name.replace('Wilcox', 'Willcox'))
-    if 'Willcox' in name:
-        variants.append(name.replace('Willcox', 'Wilcox'))
-    
-    # Handle apostrophe variants
-    if "'" in name:
-        variants.append(name.replace("'", "'"))
-    if "'" in name:
-        variants.append(name.replace("'", "'"))
+    # Typo and apostrophe variants
+    variants.extend(_swap_variants(name, _HCR_TYPO_SWAPS))
     
     # Handle F. Lee vs F.Lee
-    if re.match(r'^[A-Z]\.\s', name):
-        variants.append(re.sub(r'^([A-Z]\.)\s', r'\1', name))
-    if re.match(r'^[A-Z]\.[A-Z]', name) and ' ' not in name[:4]:
-        variants.append(re.sub(r'^([A-Z])\.', r'\1. ', name))
+    if _RE_INITIAL_DOT_SPACE.match(name):
+        variants.append(_RE_INITIAL_DOT_SPACE.sub(r'\1', name))
+    if _RE_INITIAL_DOT_CAPITAL.match(name) and ' ' not in name[:4]:
+        variants.append(_RE_LEADING_INITIAL_DOT.sub(r'\1. ', name))
     
-    return list(set(variants))
+    return tuple(dict.fromkeys(variants))
+
+
+_HCR_UNION_LEADERS = _substring_pattern(
+    'Burnside', 'Cox', 'Franklin', 'Heitz', 'Hooker', 'Mansfield', 'McClellan',
+    'Pleasonton', 'Porter', 'Reno', 'Sigel', 'Sumner',
+)
+_HCR_CSA_LEADERS = _substring_pattern('Jackson', 'Lee', 'Longstreet', 'Stuart')
 
 
 def hcr_extract_unit_mappings(buildfile_path: Path) -> dict:
@@ -310,25 +492,22 @@ def hcr_extract_unit_mappings(buildfile_path: Path) -> dict:
         "Leaders": {"Union": {}, "Confederate": {}}
     }
     
-    slot_pattern = r'<VASSAL\.build\.widget\.PieceSlot\s+entryName="([^"]+)"[^>]*>([^<]*)</VASSAL\.build\.widget\.PieceSlot>'
-    
-    for match in re.finditer(slot_pattern, content, re.DOTALL):
+    for match in _RE_PIECE_SLOT.finditer(content):
         entry_name = match.group(1)
         slot_content = match.group(2)
         
-        image_match = re.search(r'piece;;;([^;]+);[^/]+/', slot_content)
+        image_match = _RE_PIECE_IMAGE.search(slot_content)
         if not image_match:
             continue
         image_file = image_match.group(1)
         
         if 'prototype;Leader' in slot_content:
-            if any(name in entry_name for name in ['Burnside', 'Cox', 'Franklin', 'Heitz', 'Hooker', 
-                    'Mansfield', 'McClellan', 'Pleasonton', 'Porter', 'Reno', 'Sigel', 'Sumner']):
+            if _HCR_UNION_LEADERS.search(entry_name):
                 mappings["Leaders"]["Union"][entry_name] = image_file
-            elif any(name in entry_name for name in ['Jackson', 'Lee', 'Longstreet', 'Stuart']):
+            elif _HCR_CSA_LEADERS.search(entry_name):
                 mappings["Leaders"]["Confederate"][entry_name] = image_file
         else:
-            type_match = re.search(r'prototype;(USA|CSA)\s+(Infantry|Cavalry)\s+(Division|Brigade|Regiment|Sub)', slot_content)
+            type_match = _RE_UNIT_PROTOTYPE_SUB.search(slot_content)
             if type_match:
                 side = "Union" if type_match.group(1) == "USA" else "Confederate"
                 unit_type = f"{type_match.group(2)} {type_match.group(3)}"
@@ -351,9 +530,10 @@ HCR_CONFIG = GameConfig(
 # OTR2 Configuration
 # -----------------------------------------------------------------------------
 
-def otr2_get_name_variants(name: str) -> list[str]:
+@functools.lru_cache(maxsize=4096)
+def otr2_get_name_variants(name: str) -> tuple[str, ...]:
     """Generate variants of a name for fuzzy matching (OTR2-specific)."""
-    variants = base_get_name_variants(name)
+    variants = list(base_get_name_variants(name))
     
     # Handle Grifffith typo
     if 'Griffith' in name:
@@ -362,12 +542,12 @@ def otr2_get_name_variants(name: str) -> list[str]:
         variants.append(name.replace('Grifffith', 'Griffith'))
     
     # Handle missing spaces: "4PA" -> "4 PA"
-    no_space_match = re.match(r'^(\d+)([A-Z]{2,})$', name)
+    no_space_match = _RE_NUMBER_STATE.match(name)
     if no_space_match:
         variants.append(f"{no_space_match.group(1)} {no_space_match.group(2)}")
     
     # Handle DH Hill vs DH-Hill vs D.H. Hill
-    if re.match(r'^[A-Z]{2}\s', name):
+    if _has_two_initials(name):
         base = name[2:].strip()
         variants.append(f"{name[0]}.{name[1]}. {base}")
         variants.append(f"{name[0]}{name[1]}-{base}")
@@ -401,7 +581,26 @@ def otr2_get_name_variants(name: str) -> list[str]:
     if 'MRif' in name:
         variants.append(name.replace('MRif', 'Mrif'))
     
-    return list(set(variants))
+    return tuple(dict.fromkeys(variants))
+
+
+_OTR2_ENTRY_SKIP = _substring_pattern(
+    'VP', 'Ammu', 'Bridge', 'Wagon', 'Command', 'Ope', 'Mov', 'Track', 'CP',
+    'Paralysis',
+)
+_OTR2_IMAGE_SKIP = _substring_pattern(
+    'VP', 'Ammu', 'Control', 'Rv.', 'Ope.', 'Wagon', 'CP.',
+)
+_OTR2_CSA_LEADER_IMAGES = frozenset({
+    'Lee.jpg', 'Jackson.jpg', 'Johnston.jpg', 'Stuart.jpg',
+    'Longstreet.jpg', 'Magruder.jpg', 'Smith.jpg',
+    'AP-Hill.jpg', 'DH-Hill.jpg', 'DR-Jones.jpg',
+})
+_OTR2_UNION_LEADER_IMAGES = frozenset({
+    'McClelland.jpg', 'Franklin.jpg', 'Heintzelman.jpg',
+    'Keyes.jpg', 'McDowell.jpg', 'Porter.jpg',
+    'Sumner.jpg', 'Burnside.jpg',
+})
 
 
 def otr2_extract_unit_mappings(buildfile_path: Path) -> dict:
@@ -414,31 +613,23 @@ def otr2_extract_unit_mappings(buildfile_path: Path) -> dict:
         "Leaders": {"Union": {}, "Confederate": {}}
     }
     
-    piece_pattern = r'piece;;;([A-Za-z0-9_-]+\.(?:jpg|gif));([^/]+)/'
-    
-    for match in re.finditer(piece_pattern, content):
+    for match in _RE_OTR2_PIECE.finditer(content):
         image_file = match.group(1)
         unit_name = match.group(2).strip()
         
         # Skip markers
-        if any(skip in unit_name for skip in ['VP', 'Ammu', 'Bridge', 'Wagon', 
-                'Command', 'Ope', 'Mov', 'Track', 'CP', 'Paralysis']):
+        if _OTR2_ENTRY_SKIP.search(unit_name):
             continue
-        if any(skip in image_file for skip in ['VP', 'Ammu', 'Control', 'Rv.', 
-                'Ope.', 'Wagon', 'CP.']):
+        if _OTR2_IMAGE_SKIP.search(image_file):
             continue
         
         if image_file.startswith('USA_'):
             mappings['Union'][unit_name] = {'image': image_file, 'type': 'Unit'}
         elif image_file.startswith('CSA_'):
             mappings['Confederate'][unit_name] = {'image': image_file, 'type': 'Unit'}
-        elif image_file in ['Lee.jpg', 'Jackson.jpg', 'Johnston.jpg', 'Stuart.jpg', 
-                           'Longstreet.jpg', 'Magruder.jpg', 'Smith.jpg', 
-                           'AP-Hill.jpg', 'DH-Hill.jpg', 'DR-Jones.jpg']:
+        elif image_file in _OTR2_CSA_LEADER_IMAGES:
             mappings['Leaders']['Confederate'][unit_name] = image_file
-        elif image_file in ['McClelland.jpg', 'Franklin.jpg', 'Heintzelman.jpg',
-                           'Keyes.jpg', 'McDowell.jpg', 'Porter.jpg', 
-                           'Sumner.jpg', 'Burnside.jpg']:
+        elif image_file in _OTR2_UNION_LEADER_IMAGES:
             mappings['Leaders']['Union'][unit_name] = image_file
     
     return mappings
@@ -459,12 +650,13 @@ OTR2_CONFIG = GameConfig(
 # HSN Configuration
 # -----------------------------------------------------------------------------
 
-def hsn_get_name_variants(name: str) -> list[str]:
+@functools.lru_cache(maxsize=4096)
+def hsn_get_name_variants(name: str) -> tuple[str, ...]:
     """Generate variants of a name for fuzzy matching (HSN-specific)."""
-    variants = base_get_name_variants(name)
+    variants = list(base_get_name_variants(name))
     
     # Handle "J Miller" vs "J. Miller"
-    if re.match(r'^[A-Z]\s', name):
+    if _has_one_initial(name):
         base = name[2:]
         variants.append(f"{name[0]}. {base}")
         variants.append(f"{name[0]}{base}")
@@ -525,7 +717,13 @@ def hsn_get_name_variants(name: str) -> list[str]:
     if not name.endswith('@'):
         variants.append(name + '@')
     
-    return list(set(variants))
+    return tuple(dict.fromkeys(variants))
+
+
+_HSN_ENTRY_SKIP = _substring_pattern(
+    'vp', 'wagon', 'control', 'track', 'paralysis', 'game-turn', 'cycle', 'supply',
+    'event', 'posture', 'mov', 'ope',
+)
 
 
 def hsn_extract_unit_mappings(buildfile_path: Path) -> dict:
@@ -538,20 +736,17 @@ def hsn_extract_unit_mappings(buildfile_path: Path) -> dict:
         "Leaders": {"Union": {}, "Confederate": {}}
     }
     
-    slot_pattern = r'<VASSAL\.build\.widget\.PieceSlot\s+entryName="([^"]+)"[^>]*>([^<]*)</VASSAL\.build\.widget\.PieceSlot>'
-    
-    for match in re.finditer(slot_pattern, content, re.DOTALL):
+    for match in _RE_PIECE_SLOT.finditer(content):
         entry_name = match.group(1)
         slot_content = match.group(2)
         
-        image_match = re.search(r'piece;;;([^;]+\.jpg);[^/]+/', slot_content, re.IGNORECASE)
+        image_match = _RE_PIECE_JPG.search(slot_content)
         if not image_match:
             continue
         image_file = image_match.group(1)
         
         # Skip markers and non-unit items
-        if any(skip in entry_name.lower() for skip in ['vp', 'wagon', 'control', 'track', 
-                'paralysis', 'game-turn', 'cycle', 'supply', 'event', 'posture', 'mov', 'ope']):
+        if _HSN_ENTRY_SKIP.search(entry_name.lower()):
             continue
         
         if 'prototype;Leader' in slot_content:
@@ -562,7 +757,7 @@ def hsn_extract_unit_mappings(buildfile_path: Path) -> dict:
                 mappings["Leaders"]["Confederate"][entry_name] = image_file
         else:
             # Determine side and type from prototypes
-            type_match = re.search(r'prototype;(USA|CSA)\s+(Infantry|Cavalry)\s+(Division|Brigade|Regiment)', slot_content)
+            type_match = _RE_UNIT_PROTOTYPE.search(slot_content)
             if type_match:
                 side = "Union" if type_match.group(1) == "USA" else "Confederate"
                 unit_type = f"{type_match.group(2)} {type_match.group(3)}"
@@ -584,6 +779,12 @@ HSN_CONFIG = GameConfig(
 # RWH (Rebels in the White House) Configuration  
 # -----------------------------------------------------------------------------
 
+_RWH_ENTRY_SKIP = _substring_pattern(
+    'vp', 'wagon', 'control', 'track', 'paralysis', 'game-turn', 'cycle', 'supply',
+    'event', 'posture', 'mov', 'ope',
+)
+
+
 def rwh_extract_unit_mappings(buildfile_path: Path) -> dict:
     """Extract unit->background mappings from RWH buildFile.xml."""
     with open(buildfile_path) as f:
@@ -595,20 +796,17 @@ def rwh_extract_unit_mappings(buildfile_path: Path) -> dict:
         "Leaders": {"Union": {}, "Confederate": {}}
     }
     
-    slot_pattern = r'<VASSAL\.build\.widget\.PieceSlot\s+entryName="([^"]+)"[^>]*>([^<]*)</VASSAL\.build\.widget\.PieceSlot>'
-    
-    for match in re.finditer(slot_pattern, content, re.DOTALL):
+    for match in _RE_PIECE_SLOT.finditer(content):
         entry_name = match.group(1)
         slot_content = match.group(2)
         
-        image_match = re.search(r'piece;;;([^;]+\.jpg);[^/]+/', slot_content, re.IGNORECASE)
+        image_match = _RE_PIECE_JPG.search(slot_content)
         if not image_match:
             continue
         image_file = image_match.group(1)
         
         # Skip markers and non-unit items
-        if any(skip in entry_name.lower() for skip in ['vp', 'wagon', 'control', 'track', 
-                'paralysis', 'game-turn', 'cycle', 'supply', 'event', 'posture', 'mov', 'ope']):
+        if _RWH_ENTRY_SKIP.search(entry_name.lower()):
             continue
         
         # Determine if it's a leader based on image filename
@@ -650,31 +848,32 @@ RWH_CONFIG = GameConfig(
 # TOM (Thunder on Marsh Run) Configuration
 # -----------------------------------------------------------------------------
 
-def tom_get_name_variants(name: str) -> list[str]:
+@functools.lru_cache(maxsize=4096)
+def tom_get_name_variants(name: str) -> tuple[str, ...]:
     """Generate variants of a name for fuzzy matching (TOM-specific)."""
-    variants = base_get_name_variants(name)
+    variants = list(base_get_name_variants(name))
     
     # Handle "49/69 IN" vs "49 / 69 IN" vs "49/69 IN"
     if '/' in name:
         # Add versions with spaces around slash
-        variants.append(re.sub(r'(\d+)/(\d+)', r'\1 / \2', name))
+        variants.append(_RE_SLASH_PAIR.sub(r'\1 / \2', name))
         # Add version without IN suffix
-        base = re.sub(r'\s+IN$', '', name)
+        base = _RE_IN_SUFFIX.sub('', name)
         if base != name:
             variants.append(base)
-            variants.append(re.sub(r'(\d+)/(\d+)', r'\1 / \2', base))
+            variants.append(_RE_SLASH_PAIR.sub(r'\1 / \2', base))
     
     # Handle "(dmnt)" vs "Dmt" dismounted variants
     if '(dmnt)' in name.lower():
         # "1 MO (dmnt)" -> "1 MO Dmt"
-        variants.append(re.sub(r'\s*\(dmnt\)', ' Dmt', name, flags=re.IGNORECASE))
+        variants.append(_RE_DMNT.sub(' Dmt', name))
     if 'dmt' in name.lower():
         # "1 MO Dmt" -> "1 MO (dmnt)"
-        variants.append(re.sub(r'\s+dmt', ' (dmnt)', name, flags=re.IGNORECASE))
+        variants.append(_RE_DMT.sub(' (dmnt)', name))
     
     # Handle "25/29 GA" style combined regiments
-    if re.match(r'^\d+/\d+\s+[A-Z]{2}', name):
-        variants.append(re.sub(r'(\d+)/(\d+)', r'\1 / \2', name))
+    if _RE_COMBINED_REGIMENT.match(name):
+        variants.append(_RE_SLASH_PAIR.sub(r'\1 / \2', name))
     
     # Handle "AJ Smith" vs "AJ Smith - A" vs "AJ Smith-A"
     if 'AJ Smith' in name or 'A J Smith' in name:
@@ -690,16 +889,25 @@ def tom_get_name_variants(name: str) -> list[str]:
         variants.extend(['AW Reynolds', 'A W Reynolds', 'A.W. Reynolds'])
     
     # Handle "WS Smith" vs "W S Smith" vs "W.S. Smith"
-    if re.match(r'^[A-Z]{2}\s', name):
+    if _has_two_initials(name):
         base = name[2:].strip()
         variants.append(f"{name[0]} {name[1]} {base}")
         variants.append(f"{name[0]}.{name[1]}. {base}")
-    if re.match(r'^[A-Z]\s[A-Z]\s', name):
+    if _has_spaced_initials(name):
         base = name[4:].strip()
         variants.append(f"{name[0]}{name[2]} {base}")
         variants.append(f"{name[0]}.{name[2]}. {base}")
     
-    return list(set(variants))
+    return tuple(dict.fromkeys(variants))
+
+
+_TOM_ENTRY_SKIP = _substring_pattern(
+    'vp', 'wagon', 'control', 'track', 'paralysis', 'game-turn', 'cycle', 'supply',
+    'event', 'posture', 'mov', 'ope', 'ammunition', 'bridge', 'command',
+)
+_TOM_IMAGE_SKIP = _substring_pattern(
+    'vp', 'control', 'wagon', 'cp.', 'track', 'paralysis', 'ammu', 'event',
+)
 
 
 def tom_extract_unit_mappings(buildfile_path: Path) -> dict:
@@ -712,24 +920,19 @@ def tom_extract_unit_mappings(buildfile_path: Path) -> dict:
         "Leaders": {"Union": {}, "Confederate": {}}
     }
     
-    slot_pattern = r'<VASSAL\.build\.widget\.PieceSlot\s+entryName="([^"]+)"[^>]*>([^<]*)</VASSAL\.build\.widget\.PieceSlot>'
-    
-    for match in re.finditer(slot_pattern, content, re.DOTALL):
+    for match in _RE_PIECE_SLOT.finditer(content):
         entry_name = match.group(1)
         slot_content = match.group(2)
         
-        image_match = re.search(r'piece;;;([^;]+\.jpg);[^/]+/', slot_content, re.IGNORECASE)
+        image_match = _RE_PIECE_JPG.search(slot_content)
         if not image_match:
             continue
         image_file = image_match.group(1)
         
         # Skip markers and non-unit items
-        if any(skip in entry_name.lower() for skip in ['vp', 'wagon', 'control', 'track',
-                'paralysis', 'game-turn', 'cycle', 'supply', 'event', 'posture', 'mov', 'ope',
-                'ammunition', 'bridge', 'command']):
+        if _TOM_ENTRY_SKIP.search(entry_name.lower()):
             continue
-        if any(skip in image_file.lower() for skip in ['vp', 'control', 'wagon', 'cp.',
-                'track', 'paralysis', 'ammu', 'event']):
+        if _TOM_IMAGE_SKIP.search(image_file.lower()):
             continue
         
         if 'prototype;Leader' in slot_content:
@@ -740,7 +943,7 @@ def tom_extract_unit_mappings(buildfile_path: Path) -> dict:
                 mappings["Leaders"]["Confederate"][entry_name] = image_file
         else:
             # Determine side and type from prototypes
-            type_match = re.search(r'prototype;(USA|CSA)\s+(Infantry|Cavalry)\s+(Division|Brigade|Regiment)', slot_content)
+            type_match = _RE_UNIT_PROTOTYPE.search(slot_content)
             if type_match:
                 side = "Union" if type_match.group(1) == "USA" else "Confederate"
                 unit_type = f"{type_match.group(2)} {type_match.group(3)}"
@@ -763,13 +966,19 @@ TOM_CONFIG = GameConfig(
 # TPC (The Peninsula Campaign) Configuration
 # -----------------------------------------------------------------------------
 
-def tpc_get_name_variants(name: str) -> list[str]:
+_TPC_TYPO_SWAPS = (
+    ('Warren', 'Warrent'), ('Warrent', 'Warren'),
+    ('Torbert', 'Torber'), ('Torber', 'Torbert'),
+)
+
+@functools.lru_cache(maxsize=4096)
+def tpc_get_name_variants(name: str) -> tuple[str, ...]:
     """Generate variants of a name for fuzzy matching (TPC-specific)."""
-    variants = base_get_name_variants(name)
+    variants = list(base_get_name_variants(name))
     
     # Handle regiment numbers with slashes: "10/37 Clrd" vs "10 / 37 Clrd"
     if '/' in name:
-        variants.append(re.sub(r'(\d+)/(\d+)', r'\1 / \2', name))
+        variants.append(_RE_SLASH_PAIR.sub(r'\1 / \2', name))
     
     # Handle "Clrd" vs "Colored"
     if 'Clrd' in name:
@@ -778,43 +987,35 @@ def tpc_get_name_variants(name: str) -> list[str]:
         variants.append(name.replace('Colored', 'Clrd'))
     
     # Handle initials: "AJ Smith" vs "A J Smith" vs "A.J. Smith"
-    if re.match(r'^[A-Z]{2}\s', name):
+    if _has_two_initials(name):
         base = name[2:].strip()
         variants.append(f"{name[0]} {name[1]} {base}")
         variants.append(f"{name[0]}.{name[1]}. {base}")
-    if re.match(r'^[A-Z]\s[A-Z]\s', name):
+    if _has_spaced_initials(name):
         base = name[4:].strip()
         variants.append(f"{name[0]}{name[2]} {base}")
         variants.append(f"{name[0]}.{name[2]}. {base}")
     
     # Handle "Birney II" vs "Birney - II" vs "Birney-II"
-    if re.search(r'\s+(II|X|XVIII|XIX|XXIV|XXV|I|V|VI|IX)$', name):
+    if _RE_CORPS_SUFFIX.search(name):
         # "Birney II" -> "Birney - II", "Birney-II"
-        variants.append(re.sub(r'\s+([IVX]+)$', r' - \1', name))
-        variants.append(re.sub(r'\s+([IVX]+)$', r'-\1', name))
-    if ' - ' in name and re.search(r'\s+-\s+(II|X|XVIII|XIX|XXIV|XXV|I|V|VI|IX)$', name):
+        variants.append(_RE_ROMAN_SUFFIX.sub(r' - \1', name))
+        variants.append(_RE_ROMAN_SUFFIX.sub(r'-\1', name))
+    if ' - ' in name and _RE_DASHED_CORPS_SUFFIX.search(name):
         # "Birney - II" -> "Birney II", "Birney-II"
-        variants.append(re.sub(r'\s+-\s+([IVX]+)$', r' \1', name))
-        variants.append(re.sub(r'\s+-\s+([IVX]+)$', r'-\1', name))
-    if '-' in name and not ' - ' in name and re.search(r'-([IVX]+)$', name):
+        variants.append(_RE_DASHED_ROMAN_SUFFIX.sub(r' \1', name))
+        variants.append(_RE_DASHED_ROMAN_SUFFIX.sub(r'-\1', name))
+    if '-' in name and not ' - ' in name and _RE_HYPHEN_ROMAN_SUFFIX.search(name):
         # "Birney-II" -> "Birney II", "Birney - II"
-        variants.append(re.sub(r'-([IVX]+)$', r' \1', name))
-        variants.append(re.sub(r'-([IVX]+)$', r' - \1', name))
+        variants.append(_RE_HYPHEN_ROMAN_SUFFIX.sub(r' \1', name))
+        variants.append(_RE_HYPHEN_ROMAN_SUFFIX.sub(r' - \1', name))
     
     # Handle "-B" leader variants: "Hancock-B" vs "Hancock"
-    if re.search(r'-[A-Z]$', name):
-        base = re.sub(r'-[A-Z]$', '', name)
-        variants.append(base)
+    if _has_dash_suffix(name):
+        variants.append(name[:-2])
     
     # TPC-specific typos and name variants
-    if 'Warren' in name:
-        variants.append(name.replace('Warren', 'Warrent'))
-    if 'Warrent' in name:
-        variants.append(name.replace('Warrent', 'Warren'))
-    if 'Torbert' in name:
-        variants.append(name.replace('Torbert', 'Torber'))
-    if 'Torber' in name:
-        variants.append(name.replace('Torber', 'Torbert'))
+    variants.extend(_swap_variants(name, _TPC_TYPO_SWAPS))
     if 'AP Hill' in name or 'AP HIll' in name:
         variants.extend(['AP Hill', 'AP HIll', 'A.P. Hill', 'APHill'])
     if 'DM Gregg' in name:
@@ -851,14 +1052,14 @@ def tpc_get_name_variants(name: str) -> list[str]:
         variants.append(name.replace('W Birney', 'W. Birney'))
     
     # Handle "Wheaton-A" vs "Wheaton - A"
-    if re.search(r'Wheaton-[A-Z]$', name):
-        variants.append(re.sub(r'Wheaton-([A-Z])$', r'Wheaton - \1', name))
-    if re.search(r'Wheaton - [A-Z]$', name):
-        variants.append(re.sub(r'Wheaton - ([A-Z])$', r'Wheaton-\1', name))
+    if _RE_WHEATON_HYPHEN.search(name):
+        variants.append(_RE_WHEATON_HYPHEN.sub(r'Wheaton - \1', name))
+    if _RE_WHEATON_DASHED.search(name):
+        variants.append(_RE_WHEATON_DASHED.sub(r'Wheaton-\1', name))
     
     # Handle Devens-24th -> Devens (strip corps suffix)
-    if re.search(r'-\d+(st|nd|rd|th)$', name):
-        variants.append(re.sub(r'-\d+(st|nd|rd|th)$', '', name))
+    if _RE_ORDINAL_SUFFIX.search(name):
+        variants.append(_RE_ORDINAL_SUFFIX.sub('', name))
     
     # Handle corps numbers: "Birney-25th" vs "Birney XXV" vs "Birney (XXIV)"
     corps_map = {
@@ -875,7 +1076,35 @@ def tpc_get_name_variants(name: str) -> list[str]:
                 variants.append(name.replace(f'-{pattern}', f' {replacement}'))
                 variants.append(name.replace(f'-{pattern}', f' ({replacement})'))
     
-    return list(set(variants))
+    return tuple(dict.fromkeys(variants))
+
+
+_TPC_ENTRY_SKIP = _substring_pattern(
+    'vp', 'wagon', 'control', 'track', 'paralysis', 'game-turn', 'cycle', 'supply',
+    'event', 'posture', 'mov', 'ope', 'ammunition', 'bridge', 'command',
+    'replacement', 'river', 'rain', 'damage', 'destroyed', 'fort', 'unfordable',
+    'extreme heat', 'late heat',
+)
+_TPC_IMAGE_SKIP = _substring_pattern(
+    'vp', 'control', 'wagon', 'cp.', 'track', 'paralysis', 'ammu', 'event',
+    'replacement', 'damage', 'destroy',
+)
+
+# TPC Petersburg Campaign (1864-65) leaders
+# Note: The VMOD incorrectly uses CL- prefix for many Union leaders, so we must identify by name
+_TPC_UNION_LEADERS = _substring_pattern(
+    'Averell', 'Birney', 'Brooks', 'Burnside', 'Butler', 'Crook', 'Custer',
+    'DM Gregg', 'Devin', 'Emory', 'Gibbon', 'Grant', 'Griffin', 'Hancock',
+    'Humphreys', 'Hunter', 'Kautz', 'Mackenzie', 'Meade', 'Merritt', 'Merrit',
+    'Ord', 'Parke', 'Sheridan', 'Sigel', 'Smith', 'Torbert', 'Upton',
+    'Warren', 'Warrent', 'Weitzel', 'Wilson', 'Wright',
+)
+_TPC_CSA_LEADERS = _substring_pattern(
+    'Anderson', 'AP Hill', 'AP HIll', 'APHill', 'Beauregard', 'BR Johnson',
+    'Breckinridge', 'Early', 'E Johnson', 'Ewell', 'F Lee', 'Field',
+    'Gordon', 'Hampton', 'Heth', 'Hoke', 'Kershaw', 'Lee', 'Longstreet',
+    'Munford', 'Pickett', 'Rosser', 'Stuart', 'WH Lee', 'WE Jones',
+)
 
 
 def tpc_extract_unit_mappings(buildfile_path: Path) -> dict:
@@ -888,58 +1117,27 @@ def tpc_extract_unit_mappings(buildfile_path: Path) -> dict:
         "Leaders": {"Union": {}, "Confederate": {}}
     }
     
-    slot_pattern = r'<VASSAL\.build\.widget\.PieceSlot\s+entryName="([^"]+)"[^>]*>([^<]*)</VASSAL\.build\.widget\.PieceSlot>'
-    
-    # TPC Petersburg Campaign (1864-65) leaders
-    # Note: The VMOD incorrectly uses CL- prefix for many Union leaders, so we must identify by name
-    union_leaders = [
-        'Averell', 'Birney', 'Brooks', 'Burnside', 'Butler', 'Crook', 'Custer', 
-        'DM Gregg', 'Devin', 'Emory', 'Gibbon', 'Grant', 'Griffin', 'Hancock', 
-        'Humphreys', 'Hunter', 'Kautz', 'Mackenzie', 'Meade', 'Merritt', 'Merrit', 
-        'Ord', 'Parke', 'Sheridan', 'Sigel', 'Smith', 'Torbert', 'Upton',
-        'Warren', 'Warrent', 'Weitzel', 'Wilson', 'Wright'
-    ]
-    csa_leaders = [
-        'Anderson', 'AP Hill', 'AP HIll', 'APHill', 'Beauregard', 'BR Johnson',
-        'Breckinridge', 'Early', 'E Johnson', 'Ewell', 'F Lee', 'Field',
-        'Gordon', 'Hampton', 'Heth', 'Hoke', 'Kershaw', 'Lee', 'Longstreet',
-        'Munford', 'Pickett', 'Rosser', 'Stuart', 'WH Lee', 'WE Jones'
-    ]
-    
-    for match in re.finditer(slot_pattern, content, re.DOTALL):
+    for match in _RE_PIECE_SLOT.finditer(content):
         entry_name = match.group(1)
         slot_content = match.group(2)
         
-        image_match = re.search(r'piece;;;([^;]+\.jpg);[^/]+/', slot_content, re.IGNORECASE)
+        image_match = _RE_PIECE_JPG.search(slot_content)
         if not image_match:
             continue
         image_file = image_match.group(1)
         
         # Skip markers and non-unit items
-        if any(skip in entry_name.lower() for skip in ['vp', 'wagon', 'control', 'track',
-                'paralysis', 'game-turn', 'cycle', 'supply', 'event', 'posture', 'mov', 'ope',
-                'ammunition', 'bridge', 'command', 'replacement', 'river', 'rain',
-                'damage', 'destroyed', 'fort', 'unfordable', 'extreme heat', 'late heat']):
+        if _TPC_ENTRY_SKIP.search(entry_name.lower()):
             continue
-        if any(skip in image_file.lower() for skip in ['vp', 'control', 'wagon', 'cp.',
-                'track', 'paralysis', 'ammu', 'event', 'replacement', 'damage', 'destroy']):
+        if _TPC_IMAGE_SKIP.search(image_file.lower()):
             continue
         
         if 'prototype;Leader' in slot_content:
             # Determine side by checking against known leader lists
             # Note: Some leaders like "Butler" appear on both sides, so we check context
-            is_union = False
-            is_csa = False
-            
             # Check entry name against leader lists
-            for leader in union_leaders:
-                if leader in entry_name:
-                    is_union = True
-                    break
-            for leader in csa_leaders:
-                if leader in entry_name:
-                    is_csa = True
-                    break
+            is_union = bool(_TPC_UNION_LEADERS.search(entry_name))
+            is_csa = bool(_TPC_CSA_LEADERS.search(entry_name))
             
             # If name matches both lists (e.g., "Butler"), use additional context
             if is_union and is_csa:
@@ -971,7 +1169,7 @@ def tpc_extract_unit_mappings(buildfile_path: Path) -> dict:
         else:
             # Determine side and type from prototypes
             # Note: Some entries have Division\emb2 (backslash after type), so don't require word boundary
-            type_match = re.search(r'prototype;(USA|CSA)\s+(Infantry|Cavalry)\s+(Division|Brigade|Regiment|Sub)', slot_content)
+            type_match = _RE_UNIT_PROTOTYPE_SUB.search(slot_content)
             if type_match:
                 side = "Union" if type_match.group(1) == "USA" else "Confederate"
                 unit_type = f"{type_match.group(2)} {type_match.group(3)}"
@@ -994,27 +1192,20 @@ TPC_CONFIG = GameConfig(
 # AGA (All Green Alike) Configuration
 # -----------------------------------------------------------------------------
 
-def aga_get_name_variants(name: str) -> list[str]:
+_AGA_TYPO_SWAPS = (
+    # VASSAL abbreviates Heintzelman as "Heintzlmn"
+    ('Heintzelman', 'Heintzlmn'), ('Heintzlmn', 'Heintzelman'),
+    ('Patterson', 'Paterson'), ('Paterson', 'Patterson'),
+    ('Longenecker', 'Longnecker'), ('Longnecker', 'Longenecker'),
+)
+
+@functools.lru_cache(maxsize=4096)
+def aga_get_name_variants(name: str) -> tuple[str, ...]:
     """Generate variants of a name for fuzzy matching (AGA-specific)."""
-    variants = base_get_name_variants(name)
-    
-    # Handle Heintzelman typo in VASSAL: "Heintzlmn" vs "Heintzelman"
-    if 'Heintzelman' in name:
-        variants.append(name.replace('Heintzelman', 'Heintzlmn'))
-    if 'Heintzlmn' in name:
-        variants.append(name.replace('Heintzlmn', 'Heintzelman'))
-    
-    # Handle Patterson vs Paterson typo
-    if 'Patterson' in name:
-        variants.append(name.replace('Patterson', 'Paterson'))
-    if 'Paterson' in name:
-        variants.append(name.replace('Paterson', 'Patterson'))
-    
-    # Handle Longenecker vs Longnecker typo
-    if 'Longenecker' in name:
-        variants.append(name.replace('Longenecker', 'Longnecker'))
-    if 'Longnecker' in name:
-        variants.append(name.replace('Longnecker', 'Longenecker'))
+    variants = list(base_get_name_variants(name))
+    
+    # Typo handling
+    variants.extend(_swap_variants(name, _AGA_TYPO_SWAPS))
     
     # Handle "Jones" -> "DR Jones"
     if name == 'Jones':
@@ -1029,12 +1220,21 @@ def aga_get_name_variants(name: str) -> list[str]:
         variants.append(name.replace('Heavy Art', 'Heavy Artillery'))
     
     # Handle space variations: "13 PA" vs "13PA"
-    if re.match(r'^\d+\s+[A-Z]{2}$', name):
+    if _RE_NUMBER_SPACE_STATE.match(name):
         variants.append(name.replace(' ', ''))
-    if re.match(r'^\d+[A-Z]{2}$', name):
-        variants.append(re.sub(r'^(\d+)([A-Z]{2})$', r'\1 \2', name))
+    if _RE_NUMBER_STATE_PAIR.match(name):
+        variants.append(_RE_NUMBER_STATE_PAIR.sub(r'\1 \2', name))
     
-    return list(set(variants))
+    return tuple(dict.fromkeys(variants))
+
+
+_AGA_ENTRY_SKIP = _substring_pattern(
+    'vp', 'wagon', 'control', 'track', 'paralysis', 'game-turn', 'cycle', 'supply',
+    'event', 'posture', 'mov', 'ope', 'ammunition', 'bridge', 'command',
+)
+_AGA_IMAGE_SKIP = _substring_pattern(
+    'vp', 'control', 'wagon', 'cp.', 'track', 'paralysis', 'ammu', 'event',
+)
 
 
 def aga_extract_unit_mappings(buildfile_path: Path) -> dict:
@@ -1047,24 +1247,19 @@ def aga_extract_unit_mappings(buildfile_path: Path) -> dict:
         "Leaders": {"Union": {}, "Confederate": {}}
     }
     
-    slot_pattern = r'<VASSAL\.build\.widget\.PieceSlot\s+entryName="([^"]+)"[^>]*>([^<]*)</VASSAL\.build\.widget\.PieceSlot>'
-    
-    for match in re.finditer(slot_pattern, content, re.DOTALL):
+    for match in _RE_PIECE_SLOT.finditer(content):
         entry_name = match.group(1)
         slot_content = match.group(2)
         
-        image_match = re.search(r'piece;;;([^;]+\.jpg);[^/]+/', slot_content, re.IGNORECASE)
+        image_match = _RE_PIECE_JPG.search(slot_content)
         if not image_match:
             continue
         image_file = image_match.group(1)
         
         # Skip markers and non-unit items
-        if any(skip in entry_name.lower() for skip in ['vp', 'wagon', 'control', 'track',
-                'paralysis', 'game-turn', 'cycle', 'supply', 'event', 'posture', 'mov', 'ope',
-                'ammunition', 'bridge', 'command']):
+        if _AGA_ENTRY_SKIP.search(entry_name.lower()):
             continue
-        if any(skip in image_file.lower() for skip in ['vp', 'control', 'wagon', 'cp.',
-                'track', 'paralysis', 'ammu', 'event']):
+        if _AGA_IMAGE_SKIP.search(image_file.lower()):
             continue
         
         if 'prototype;Leader' in slot_content:
@@ -1075,7 +1270,7 @@ def aga_extract_unit_mappings(buildfile_path: Path) -> dict:
                 mappings["Leaders"]["Confederate"][entry_name] = image_file
         else:
             # Determine side and type from prototypes
-            type_match = re.search(r'prototype;(USA|CSA)\s+(Infantry|Cavalry)\s+(Division|Brigade|Regiment)', slot_content)
+            type_match = _RE_UNIT_PROTOTYPE.search(slot_content)
             if type_match:
                 side = "Union" if type_match.group(1) == "USA" else "Confederate"
                 unit_type = f"{type_match.group(2)} {type_match.group(3)}"
@@ -1098,10 +1293,11 @@ AGA_CONFIG = GameConfig(
 # SJW (Stonewall Jackson's Way) Configuration
 # -----------------------------------------------------------------------------
 
-def sjw_get_name_variants(name: str) -> list[str]:
+@functools.lru_cache(maxsize=4096)
+def sjw_get_name_variants(name: str) -> tuple[str, ...]:
     """Generate variants of a name for fuzzy matching (SJW-specific)."""
     # SJW shares the same rules as AGA, so start with AGA variants
-    variants = aga_get_name_variants(name)
+    variants = list(aga_get_name_variants(name))
     
     # Handle Confederate leaders with initials
     # PDF has "A.P. Hill", VASSAL has "AP Hill"
@@ -1117,7 +1313,17 @@ def sjw_get_name_variants(name: str) -> list[str]:
         if name in vassal_variants:
             variants.append(pdf_name)
     
-    return list(set(variants))
+    return tuple(dict.fromkeys(variants))
+
+
+_SJW_ENTRY_SKIP = _substring_pattern(
+    'vp', 'wagon', 'control', 'track', 'paralysis', 'game-turn', 'cycle', 'supply',
+    'event', 'posture', 'movement', 'ammunition', 'bridge', 'command',
+    'operations',
+)
+_SJW_IMAGE_SKIP = _substring_pattern(
+    'vp', 'control', 'wagon', 'cp.', 'track', 'paralysis', 'ammu', 'event',
+)
 
 
 def sjw_extract_unit_mappings(buildfile_path: Path) -> dict:
@@ -1131,25 +1337,20 @@ def sjw_extract_unit_mappings(buildfile_path: Path) -> dict:
         "Leaders": {"Union": {}, "Confederate": {}}
     }
     
-    slot_pattern = r'<VASSAL\.build\.widget\.PieceSlot\s+entryName="([^"]+)"[^>]*>([^<]*)</VASSAL\.build\.widget\.PieceSlot>'
-    
-    for match in re.finditer(slot_pattern, content, re.DOTALL):
+    for match in _RE_PIECE_SLOT.finditer(content):
         entry_name = match.group(1)
         slot_content = match.group(2)
         
-        image_match = re.search(r'piece;;;([^;]+\.jpg);[^/]+/', slot_content, re.IGNORECASE)
+        image_match = _RE_PIECE_JPG.search(slot_content)
         if not image_match:
             continue
         image_file = image_match.group(1)
         
         # Skip markers and non-unit items
         # Note: Use longer patterns to avoid false matches (e.g., 'ope' matches 'Pope')
-        if any(skip in entry_name.lower() for skip in ['vp', 'wagon', 'control', 'track',
-                'paralysis', 'game-turn', 'cycle', 'supply', 'event', 'posture', 'movement',
-                'ammunition', 'bridge', 'command', 'operations']):
+        if _SJW_ENTRY_SKIP.search(entry_name.lower()):
             continue
-        if any(skip in image_file.lower() for skip in ['vp', 'control', 'wagon', 'cp.',
-                'track', 'paralysis', 'ammu', 'event']):
+        if _SJW_IMAGE_SKIP.search(image_file.lower()):
             continue
         
         if 'prototype;Leader' in slot_content:
@@ -1160,7 +1361,7 @@ def sjw_extract_unit_mappings(buildfile_path: Path) -> dict:
                 mappings["Leaders"]["Confederate"][entry_name] = image_file
         else:
             # Determine side and type from prototypes
-            type_match = re.search(r'prototype;(USA|CSA)\s+(Infantry|Cavalry)\s+(Division|Brigade|Regiment)', slot_content)
+            type_match = _RE_UNIT_PROTOTYPE.search(slot_content)
             if type_match:
                 side = "Union" if type_match.group(1) == "USA" else "Confederate"
                 unit_type = f"{type_match.group(2)} {type_match.group(3)}"
@@ -1200,6 +1401,33 @@ GAME_CONFIGS: dict[str, GameConfig] = {
 # Shared counter generation logic
 # =============================================================================
 
+FONT_CANDIDATES = [
+    '/System/Library/Fonts/Helvetica.ttc',
+    '/System/Library/Fonts/Geneva.ttf',
+    'Arial.ttf',
+    'Helvetica.ttf',
+    'DejaVuSans.ttf',
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_font(font_size: int):
+    """Load the first available font at the given size, probing the candidates only once."""
+    for font_name in FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(font_name, font_size)
+        except (OSError, IOError):
+            continue
+    return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=64)
+def _load_background(background_path: Path, mode: str):
+    """Decode a background once per process; many units share the same template."""
+    return Image.open(background_path).convert(mode)
+
+
 def generate_counter_image(
     background_path: Path,
     unit_name: str,
@@ -1211,39 +1439,48 @@ def generate_counter_image(
         shutil.copy2(background_path, output_path)
         return
     
-    bg = Image.open(background_path).convert('RGBA')
+    # Draw straight onto RGB for JPEG output; only keep alpha when the format can store it
+    mode = 'RGB' if output_path.suffix.lower() in ['.jpg', '.jpeg'] else 'RGBA'
+    bg = _load_background(background_path, mode).copy()
     draw = ImageDraw.Draw(bg)
+    font = _get_font(font_size)
     
-    font = None
-    for font_name in [
-        '/System/Library/Fonts/Helvetica.ttc',
-        '/System/Library/Fonts/Geneva.ttf',
-        'Arial.ttf', 
-        'Helvetica.ttf', 
-        'DejaVuSans.ttf',
-        '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'
-    ]:
-        try:
-            font = ImageFont.truetype(font_name, font_size)
-            break
-        except (OSError, IOError):
-            continue
-    
-    if font is None:
-        font = ImageFont.load_default()
-    
-    bbox = draw.textbbox((0, 0), unit_name, font=font)
-    text_width = bbox[2] - bbox[0]
-    
+    # Advance width is all centering needs; textbbox would rasterize the glyph extents
+    text_width = int(font.getlength(unit_name))
+
     x = (bg.width - text_width) // 2
     y = 3
     
-    draw.text((x, y), unit_name, fill=(0, 0, 0, 255), font=font)
+    draw.text((x, y), unit_name, fill=(0, 0, 0), font=font)
     
-    if output_path.suffix.lower() in ['.jpg', '.jpeg']:
-        bg = bg.convert('RGB')
-    
-    bg.save(output_path, quality=95)
+    # A buffer larger than any counter turns the encoder's chunked writes into one write
+    with open(output_path, 'wb', buffering=1 << 20) as f:
+        bg.save(f, quality=95)
+
+
+def _module_image(images_dir: Path, img_file: str, vmod: zipfile.ZipFile | None = None) -> Path:
+    """Path to a module image, extracting it from the .vmod archive on first use."""
+    path = images_dir / img_file
+    if vmod is not None and not path.exists():
+        try:
+            vmod.extract(f'images/{img_file}', images_dir.parent)
+        except KeyError:
+            pass
+    return path
+
+
+def _is_up_to_date(dst: Path, src_mtime: float) -> bool:
+    """True when dst exists and is at least as new as its source."""
+    try:
+        return dst.stat().st_mtime >= src_mtime
+    except FileNotFoundError:
+        return False
+
+
+def _render_one(task: tuple[Path, tuple[Path, str]]):
+    """Process pool entry point for generate_counter_image."""
+    dst, (src, unit_name) = task
+    generate_counter_image(src, unit_name, dst)
 
 
 def run_counter_generation(
@@ -1253,8 +1490,35 @@ def run_counter_generation(
     dry_run: bool = False,
     leaders_only: bool = False,
     no_text: bool = False,
+    fuzzy: bool = False,
+    jobs: int | None = None,
+    incremental: bool = False,
 ):
     """Main counter generation logic shared across all games."""
+    # An opened .vmod and its scratch directory are released however the run ends
+    with contextlib.ExitStack() as cleanup:
+        _run_counter_generation(
+            cleanup, game_id, source, output_dir, dry_run, leaders_only,
+            no_text, fuzzy, jobs, incremental,
+        )
+
+
+def _run_counter_generation(
+    cleanup: contextlib.ExitStack,
+    game_id: str,
+    source: Path,
+    output_dir: Path | None,
+    dry_run: bool,
+    leaders_only: bool,
+    no_text: bool,
+    fuzzy: bool,
+    jobs: int | None,
+    incremental: bool,
+):
+    """Body of run_counter_generation; resources are registered on cleanup."""
+    if fuzzy and not HAS_RAPIDFUZZ:
+        print("Warning: rapidfuzz not installed, fuzzy matching disabled. Run: uv sync --extra fuzzy")
+        fuzzy = False
     
     config = GAME_CONFIGS.get(game_id)
     if not config:
@@ -1267,11 +1531,18 @@ def run_counter_generation(
         raise ValueError(f"No extract_mappings_fn defined for {game_id}")
     
     # Find or extract the module
+    vmod = None
     if source.is_file() and source.suffix.lower() == '.vmod':
-        temp_dir = Path(tempfile.mkdtemp())
+        temp_dir = Path(cleanup.enter_context(tempfile.TemporaryDirectory()))
         print(f"Extracting {source}...")
-        with zipfile.ZipFile(source, 'r') as z:
-            z.extractall(temp_dir)
+        # Only the build file is extracted up front; images are pulled from
+        # the archive as matched units reference them (see _module_image)
+        vmod = cleanup.enter_context(zipfile.ZipFile(source, 'r'))
+        names = vmod.namelist()
+        if 'buildFile.xml' in names:
+            vmod.extract('buildFile.xml', temp_dir)
+        if any(n.startswith('images/') for n in names):
+            (temp_dir / 'images').mkdir()
         module_dir = temp_dir
     elif source.is_dir():
         module_dir = source
@@ -1291,6 +1562,12 @@ def run_counter_generation(
     if not images_dir.exists():
         raise ValueError(f"images directory not found in {module_dir}")
     
+    # One listing (or the archive index) answers every per-unit existence check
+    if vmod:
+        available_images = {n[len('images/'):] for n in names if n.startswith('images/')}
+    else:
+        available_images = {entry.name for entry in os.scandir(images_dir)}
+    
     print(f"Parsing {buildfile}...")
     mappings = extract_unit_mappings(buildfile)
     
@@ -1298,19 +1575,26 @@ def run_counter_generation(
     parsed_file = Path(__file__).parent.parent / 'parsed' / f'{game_id}_parsed.json'
     parsed_units = {'Union': {}, 'Confederate': {}}
     if parsed_file.exists():
-        with open(parsed_file) as f:
-            data = json.load(f)
+        if HAS_ORJSON:
+            data = orjson.loads(parsed_file.read_bytes())
+        else:
+            with open(parsed_file) as f:
+                data = json.load(f)
+        confederate = parsed_units['Confederate']
+        union = parsed_units['Union']
         for scenario in data:
-            for unit in scenario.get('confederate_units', []):
-                name = unit['unit_leader']
+            for unit in scenario.get('confederate_units', ()):
                 utype = unit.get('unit_type', 'Inf')
-                if name not in parsed_units['Confederate'] or utype == 'Ldr':
-                    parsed_units['Confederate'][name] = utype
-            for unit in scenario.get('union_units', []):
-                name = unit['unit_leader']
+                if utype == 'Ldr':
+                    confederate[unit['unit_leader']] = utype
+                else:
+                    confederate.setdefault(unit['unit_leader'], utype)
+            for unit in scenario.get('union_units', ()):
                 utype = unit.get('unit_type', 'Inf')
-                if name not in parsed_units['Union'] or utype == 'Ldr':
-                    parsed_units['Union'][name] = utype
+                if utype == 'Ldr':
+                    union[unit['unit_leader']] = utype
+                else:
+                    union.setdefault(unit['unit_leader'], utype)
         print(f"Loaded {len(parsed_units['Union'])} Union and {len(parsed_units['Confederate'])} Confederate units from parsed data")
     
     print(f"\n=== VASSAL Unit Mappings ===")
@@ -1320,24 +1604,26 @@ def run_counter_generation(
     print(f"Confederate Units: {len(mappings['Confederate'])}")
     
     if dry_run:
-        print("\n--- Union Leaders ---")
+        # Build the whole listing first and write it once
+        lines = ["\n--- Union Leaders ---"]
         for name, img in sorted(mappings['Leaders']['Union'].items()):
-            print(f"  {name}: {img}")
+            lines.append(f"  {name}: {img}")
         
-        print("\n--- Confederate Leaders ---")
+        lines.append("\n--- Confederate Leaders ---")
         for name, img in sorted(mappings['Leaders']['Confederate'].items()):
-            print(f"  {name}: {img}")
+            lines.append(f"  {name}: {img}")
         
-        print("\n--- Sample Union Units ---")
-        for name, info in list(sorted(mappings['Union'].items()))[:20]:
+        lines.append("\n--- Sample Union Units ---")
+        for name, info in sorted(mappings['Union'].items())[:20]:
             img = info['image'] if isinstance(info, dict) else info
-            print(f"  {name}: {img}")
+            lines.append(f"  {name}: {img}")
         
-        print("\n--- Sample Confederate Units ---")
-        for name, info in list(sorted(mappings['Confederate'].items()))[:20]:
+        lines.append("\n--- Sample Confederate Units ---")
+        for name, info in sorted(mappings['Confederate'].items())[:20]:
             img = info['image'] if isinstance(info, dict) else info
-            print(f"  {name}: {img}")
+            lines.append(f"  {name}: {img}")
         
+        print('\n'.join(lines))
         return
     
     # Determine output directory
@@ -1346,45 +1632,52 @@ def run_counter_generation(
         output_dir = Path(__file__).parent.parent.parent / 'web' / 'public' / 'images' / 'counters' / game_id
     
     output_dir.mkdir(parents=True, exist_ok=True)
+    existing_outputs = {entry.name for entry in os.scandir(output_dir)}
     
-    # Build lookup
-    vassal_lookup = {}
-    for side in ['Union', 'Confederate']:
-        for name, info in mappings.get(side, {}).items():
-            for variant in get_name_variants(name):
-                key = (side, variant)
-                if key not in vassal_lookup:
-                    vassal_lookup[key] = info
-        for name, img in mappings['Leaders'].get(side, {}).items():
-            for variant in get_name_variants(name):
-                key = (side, variant)
-                if key not in vassal_lookup:
-                    vassal_lookup[key] = {'image': img, 'type': 'Leader'}
-    
-    # Generate images
+    vassal_lookup = _build_vassal_lookup(mappings, get_name_variants)
+    
+    # Generate images. File work is queued (dst -> source) and run in bulk
+    # after matching; later entries for the same dst win, as before.
     image_map = {}
     unmatched = []
+    copies: dict[Path, Path] = {}
+    renders: dict[Path, tuple[Path, str]] = {}
+    progress: list[str] = []
+    
+    # Images pulled from an archive are only as new as the archive itself
+    vmod_mtime = source.stat().st_mtime if vmod else 0.0
     
     print("\n--- Generating Images ---")
     for side in ['Union', 'Confederate']:
         prefix = 'U' if side == 'Union' else 'C'
+        _, canonical = vassal_lookup[side]
+        if fuzzy:
+            fuzzy_candidates = list(canonical)
         for parsed_name, utype in sorted(parsed_units.get(side, {}).items()):
+            # Flush progress lines in batches rather than one write per unit
+            if len(progress) >= 64:
+                print('\n'.join(progress))
+                progress.clear()
+            
             # Skip special units
             if any(skip in parsed_name for skip in config.skip_units):
                 continue
             
             # Try to find matching VASSAL unit
-            vassal_info = None
-            for variant in get_name_variants(parsed_name):
-                key = (side, variant)
-                if key in vassal_lookup:
-                    vassal_info = vassal_lookup[key]
-                    break
+            vassal_info = _find_vassal_info(parsed_name, get_name_variants, *vassal_lookup[side])
+            
+            # Last resort: edit-distance match for typos the variant rules miss.
+            # Opt-in, since distinct leaders can be one letter apart (Clanton/Clayton).
+            if not vassal_info and fuzzy:
+                fuzzy_key = _fuzzy_key(_canon(parsed_name), fuzzy_candidates)
+                if fuzzy_key:
+                    vassal_info = canonical[fuzzy_key]
+                    progress.append(f"  Fuzzy match: {parsed_name} ~ {fuzzy_key}")
             
             # Fallback for combined regiments
             if not vassal_info and '/' in parsed_name and config.combined_regiment_bg:
                 fallback_bg = config.combined_regiment_bg.get(side)
-                if fallback_bg and (images_dir / fallback_bg).exists():
+                if fallback_bg in available_images:
                     vassal_info = {'image': fallback_bg, 'type': 'CombinedRegiment'}
             
             if not vassal_info:
@@ -1392,71 +1685,77 @@ def run_counter_generation(
                 continue
             
             img_file = vassal_info['image'] if isinstance(vassal_info, dict) else vassal_info
-            src = images_dir / img_file
-            
-            if not src.exists():
-                print(f"  Missing: {img_file} for {parsed_name}")
+            if img_file not in available_images:
+                progress.append(f"  Missing: {img_file} for {parsed_name}")
                 unmatched.append(f"{side} ({utype}): {parsed_name} [missing: {img_file}]")
                 continue
             
+            # Images are only pulled out of a .vmod once a file actually needs writing
             unit_type = vassal_info.get('type', 'Unit') if isinstance(vassal_info, dict) else 'Unit'
             
             if unit_type == 'Leader':
                 dst = output_dir / img_file
-                if not dst.exists():
-                    shutil.copy2(src, dst)
+                if img_file not in existing_outputs:
+                    copies[dst] = _module_image(images_dir, img_file, vmod)
                 image_map[f"{prefix}:{parsed_name}"] = img_file
-                print(f"  Copied: {parsed_name} -> {img_file}")
+                progress.append(f"  Copied: {parsed_name} -> {img_file}")
             elif leaders_only:
                 continue
-            elif no_text:
-                safe_name = parsed_name.replace(' ', '_').replace('.', '').replace("'", "").replace('/', '-')
-                output_file = f"{prefix}_{safe_name}.jpg"
-                dst = output_dir / output_file
-                
-                shutil.copy2(src, dst)
-                image_map[f"{prefix}:{parsed_name}"] = output_file
-                print(f"  Copied (no text): {parsed_name} -> {output_file}")
             else:
                 safe_name = parsed_name.replace(' ', '_').replace('.', '').replace("'", "").replace('/', '-')
                 output_file = f"{prefix}_{safe_name}.jpg"
                 dst = output_dir / output_file
-                
-                generate_counter_image(src, parsed_name, dst)
                 image_map[f"{prefix}:{parsed_name}"] = output_file
-                print(f"  Generated: {parsed_name} -> {output_file}")
+                
+                if incremental and _is_up_to_date(dst, vmod_mtime or (images_dir / img_file).stat().st_mtime):
+                    progress.append(f"  Up to date: {parsed_name} -> {output_file}")
+                elif no_text:
+                    copies[dst] = _module_image(images_dir, img_file, vmod)
+                    progress.append(f"  Copied (no text): {parsed_name} -> {output_file}")
+                else:
+                    renders[dst] = (_module_image(images_dir, img_file, vmod), parsed_name)
+                    progress.append(f"  Generated: {parsed_name} -> {output_file}")
+    
+    if progress:
+        print('\n'.join(progress))
+    
+    # Copies are I/O bound; compositing and JPEG encoding are CPU bound
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(shutil.copy2, copies.values(), copies.keys()))
+    if renders:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            list(pool.map(_render_one, renders.items(), chunksize=8))
     
     # Save mapping
     mapping_file = Path(__file__).parent / 'image_mappings' / f'{game_id}_images.json'
     mapping_file.parent.mkdir(exist_ok=True)
     
-    matched = {}
-    matched_with_ext = {}
-    for key, filename in image_map.items():
-        base = Path(filename).stem
-        matched[key] = base
-        matched_with_ext[key] = filename
+    # Strip the extension by slicing rather than building a Path per entry
+    matched = {key: filename.rpartition('.')[0] or filename for key, filename in image_map.items()}
     
     mapping_data = {
         'game': game_id,
         'counterType': 'template',
         'matched': matched,
-        'matched_with_ext': matched_with_ext,
+        'matched_with_ext': image_map,
         'unmatched': unmatched,
         'unused_images': [],
         'note': f'Generated by generate_counters.py for {game_id}'
     }
     
-    with open(mapping_file, 'w') as f:
-        json.dump(mapping_data, f, indent=2)
+    if HAS_ORJSON:
+        mapping_file.write_bytes(orjson.dumps(mapping_data, option=orjson.OPT_INDENT_2))
+    else:
+        # Keep non-ASCII names (D’Utassy) literal, as orjson writes them
+        with open(mapping_file, 'w', encoding='utf-8') as f:
+            json.dump(mapping_data, f, indent=2, ensure_ascii=False)
     
     print(f"\n=== Summary ===")
     print(f"Matched: {len(image_map)} units")
     print(f"Unmatched: {len(unmatched)} units")
     if unmatched:
         print("\n--- Unmatched Units ---")
-        for u in unmatched:
-            print(f"  {u}")
+        print('\n'.join(f"  {u}" for u in unmatched))
     
     print(f"\nSaved mappings to {mapping_file}")
     print(f"Images saved to {output_dir}")
@@ -1470,9 +1769,14 @@ def main():
     parser.add_argument('--dry-run', '-n', action='store_true', help='Show mappings without generating images')
     parser.add_argument('--leaders-only', action='store_true', help='Only copy leader images')
     parser.add_argument('--no-text', action='store_true', help='Copy backgrounds without text overlay')
+    parser.add_argument('--fuzzy', action='store_true', help='Fall back to edit-distance matching for unmatched units (requires rapidfuzz)')
+    parser.add_argument('--jobs', '-j', type=int, default=None, help='Worker processes for rendering (default: CPU count)')
+    parser.add_argument('--incremental', action='store_true', help='Skip unit counters that are newer than their source image')
     
     args = parser.parse_args()
-    
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('--jobs must be at least 1')
+
     # Determine source path - use argument or environment variable
     if args.source:
         source = Path(args.source).expanduser()
@@ -1494,6 +1798,9 @@ def main():
         dry_run=args.dry_run,
         leaders_only=args.leaders_only,
         no_text=args.no_text,
+        fuzzy=args.fuzzy,
+        jobs=args.jobs,
+        incremental=args.incremental,
     )
 
 
@@ -6,9 +6,24 @@ and writes to web/public/data/{game}.json
 """
 
 import json
+import multiprocessing
+import os
 import re
+import sys
 from pathlib import Path
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
 
 # Game configurations - now using parsed/ directory output
 GAMES = [
@@ -25,13 +40,71 @@ GAMES = [
 ]
 
 
+def load_json(path: Path):
+    """Load a JSON file, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def dumps_json(data) -> bytes:
+    """Serialize data as compact UTF-8 JSON bytes, using orjson when it is installed.
+
+    The json fallback matches orjson's output, including unescaped non-ASCII text.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def write_json(path: Path, data) -> None:
+    """Write data as compact JSON in a single write."""
+    path.write_bytes(dumps_json(data))
+
+
+def iter_scenarios(path: Path):
+    """Yield parsed scenarios one at a time.
+
+    Streams the top-level array with ijson when it is installed so only one
+    scenario is held in memory; otherwise loads the whole file.
+    """
+    if HAS_IJSON:
+        with open(path, "rb") as f:
+            yield from ijson.items(f, "item", use_float=True)
+    else:
+        yield from load_json(path)
+
+
+def write_game_stream(path: Path, game_id: str, game_name: str, scenarios) -> None:
+    """Write web-format game JSON one converted scenario at a time.
+
+    Produces the same bytes as write_json() on the equivalent game dict
+    without holding every scenario in memory. Output goes to a temporary
+    file beside path and replaces it only once every scenario is written,
+    so a failed conversion leaves the previous file in place.
+    """
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(b'{"id":' + dumps_json(game_id) + b',"name":' + dumps_json(game_name) + b',"scenarios":[')
+            for i, scenario in enumerate(scenarios):
+                if i:
+                    f.write(b",")
+                f.write(dumps_json(scenario))
+            f.write(b"]}")
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def load_hex_config():
     """Load hex location config for validation."""
     config_path = Path(__file__).parent.parent / "utils" / "hex_location_config.json"
     if not config_path.exists():
         return None
-    with open(config_path) as f:
-        return json.load(f)
+    return load_json(config_path)
 
 
 def validate_hex_location(hex_loc: str, config: dict) -> tuple[bool, str | None]:
@@ -89,8 +162,12 @@ def validate_hex_location(hex_loc: str, config: dict) -> tuple[bool, str | None]
     return False, "No pattern matched"
 
 
+_GUNBOAT_PREFIXES = ("Gunboat", "(Gunboat")
+
+
 def convert_unit(unit: dict) -> dict:
     """Convert a unit from parser format to web format."""
+    # A single dict literal is the cheapest way to rename the keys
     result = {
         "name": unit["unit_leader"],
         "size": unit["size"],
@@ -100,61 +177,108 @@ def convert_unit(unit: dict) -> dict:
         "hexLocation": unit["hex_location"],
         "notes": unit["notes"],
     }
-    # Include reinforcement set if present
-    if unit.get("reinforcement_set"):
-        result["reinforcementSet"] = unit["reinforcement_set"]
-    # Include table name if present
-    if unit.get("table_name"):
-        result["tableName"] = unit["table_name"]
+    # Include reinforcement set / table name if present
+    reinforcement_set = unit.get("reinforcement_set")
+    if reinforcement_set:
+        result["reinforcementSet"] = reinforcement_set
+    table_name = unit.get("table_name")
+    if table_name:
+        result["tableName"] = table_name
     return result
 
 
 def is_gunboat(unit: dict) -> bool:
     """Check if a unit is a gunboat."""
-    name = unit.get("unit_leader", "")
-    return name.startswith("Gunboat") or name.startswith("(Gunboat")
+    return unit.get("unit_leader", "").startswith(_GUNBOAT_PREFIXES)
 
 
 def convert_gunboat(unit: dict) -> dict:
     """Convert a gunboat unit to a simple text representation."""
-    name = unit["unit_leader"]
-    location = unit["hex_location"]
-    return {
-        "name": name,
-        "location": location,
-    }
+    return {"name": unit["unit_leader"], "location": unit["hex_location"]}
+
+
+def partition_units(units: list) -> tuple[list, list]:
+    """Convert units in one pass, separating gunboats from regular units."""
+    regular, gunboats = [], []
+    for unit in units:
+        if is_gunboat(unit):
+            gunboats.append(convert_gunboat(unit))
+        else:
+            regular.append(convert_unit(unit))
+    return regular, gunboats
 
 
 def convert_scenario(scenario: dict) -> dict:
     """Convert a scenario from parser format to web format."""
-    # Separate gunboats from regular units
-    csa_units = [u for u in scenario["confederate_units"] if not is_gunboat(u)]
-    csa_gunboats = [u for u in scenario["confederate_units"] if is_gunboat(u)]
-    usa_units = [u for u in scenario["union_units"] if not is_gunboat(u)]
-    usa_gunboats = [u for u in scenario["union_units"] if is_gunboat(u)]
+    csa_units, csa_gunboats = partition_units(scenario["confederate_units"])
+    usa_units, usa_gunboats = partition_units(scenario["union_units"])
     
     return {
         "number": scenario["number"],
         "name": scenario["name"],
         "confederateFootnotes": scenario.get("confederate_footnotes", {}),
         "unionFootnotes": scenario.get("union_footnotes", {}),
-        "confederateUnits": [convert_unit(u) for u in csa_units],
-        "unionUnits": [convert_unit(u) for u in usa_units],
-        "confederateGunboats": [convert_gunboat(u) for u in csa_gunboats],
-        "unionGunboats": [convert_gunboat(u) for u in usa_gunboats],
+        "confederateUnits": csa_units,
+        "unionUnits": usa_units,
+        "confederateGunboats": csa_gunboats,
+        "unionGunboats": usa_gunboats,
     }
 
 
-def convert_game_data(scenarios: list, game_id: str, game_name: str) -> dict:
-    """Convert full parser output to web format."""
-    return {
-        "id": game_id,
-        "name": game_name,
-        "scenarios": [convert_scenario(s) for s in scenarios],
-    }
+def find_unrecognized_hexes(scenario: dict, game_id: str, config: dict) -> list[dict]:
+    """Return unrecognized hex locations in a web-format scenario."""
+    unrecognized = []
+    for unit in scenario["confederateUnits"] + scenario["unionUnits"]:
+        hex_loc = unit.get("hexLocation", "")
+        is_valid, reason = validate_hex_location(hex_loc, config)
+        if not is_valid:
+            unrecognized.append({
+                "game": game_id,
+                "scenario": scenario["number"],
+                "unit": unit["name"],
+                "hex": hex_loc,
+                "reason": reason,
+            })
+    return unrecognized
+
+
+def convert_game_file(parser_output: Path, web_output: Path, game_id: str, game_name: str,
+                      hex_config: dict | None, batch: bool = False) -> dict:
+    """Convert one game's parsed output file to web JSON.
+
+    By default scenarios are streamed through conversion one at a time;
+    batch=True loads and writes the whole game in memory instead.
+    Returns scenario/unit counts and any unrecognized hex locations.
+    """
+    stats = {"scenarios": 0, "confederate_units": 0, "union_units": 0, "unrecognized": []}
+    source = load_json(parser_output) if batch else iter_scenarios(parser_output)
+
+    def web_scenarios():
+        for scenario in source:
+            web_scenario = convert_scenario(scenario)
+            stats["scenarios"] += 1
+            stats["confederate_units"] += len(web_scenario["confederateUnits"])
+            stats["union_units"] += len(web_scenario["unionUnits"])
+            # Validate hex locations if config is available
+            if hex_config:
+                stats["unrecognized"].extend(find_unrecognized_hexes(web_scenario, game_id, hex_config))
+            yield web_scenario
+
+    if batch:
+        write_json(web_output, {
+            "id": game_id,
+            "name": game_name,
+            "scenarios": list(web_scenarios()),
+        })
+    else:
+        write_game_stream(web_output, game_id, game_name, web_scenarios())
+    return stats
 
 
 def main():
+    # --batch loads each parsed file whole instead of streaming it
+    batch = "--batch" in sys.argv[1:]
+
     parser_dir = Path(__file__).parent.parent  # Go up from pipeline/ to parser/
     parsed_dir = parser_dir / "parsed"
     web_data_dir = parser_dir.parent / "web" / "public" / "data"
@@ -173,6 +297,8 @@ def main():
     # Create games index
     games_index = {"games": []}
 
+    # Collect games with parser output; each converts independently
+    jobs = []
     for game in GAMES:
         game_id = game["id"]
         parser_output = parsed_dir / f"{game_id}_parsed.json"
@@ -182,43 +308,26 @@ def main():
             print(f"Skipping {game['name']}: {parser_output} not found")
             continue
 
-        # Load parser output
-        with open(parser_output) as f:
-            scenarios = json.load(f)
+        jobs.append((parser_output, web_output, game_id, game["name"], hex_config, batch))
 
-        # Convert to web format
-        game_data = convert_game_data(scenarios, game_id, game["name"])
-        
-        # Validate hex locations if config is available
-        if hex_config:
-            game_unrecognized = []
-            for scenario in game_data["scenarios"]:
-                for unit in scenario["confederateUnits"] + scenario["unionUnits"]:
-                    hex_loc = unit.get("hexLocation", "")
-                    is_valid, reason = validate_hex_location(hex_loc, hex_config)
-                    if not is_valid:
-                        game_unrecognized.append({
-                            "game": game_id,
-                            "scenario": scenario["number"],
-                            "unit": unit["name"],
-                            "hex": hex_loc,
-                            "reason": reason,
-                        })
-            if game_unrecognized:
-                all_unrecognized.extend(game_unrecognized)
-
-        # Write web output
-        with open(web_output, "w") as f:
-            json.dump(game_data, f, indent=2)
-
-        print(f"Converted {len(scenarios)} scenarios to {web_output}")
-        print(f"  Confederate units: {sum(len(s['confederateUnits']) for s in game_data['scenarios'])}")
-        print(f"  Union units: {sum(len(s['unionUnits']) for s in game_data['scenarios'])}")
+    # Convert games in parallel worker processes
+    if len(jobs) > 1:
+        with multiprocessing.Pool(min(len(jobs), os.cpu_count() or 1)) as pool:
+            results = pool.starmap(convert_game_file, jobs)
+    else:
+        results = [convert_game_file(*job) for job in jobs]
+
+    for (_, web_output, game_id, game_name, _, _), stats in zip(jobs, results):
+        all_unrecognized.extend(stats["unrecognized"])
+
+        print(f"Converted {stats['scenarios']} scenarios to {web_output}")
+        print(f"  Confederate units: {stats['confederate_units']}")
+        print(f"  Union units: {stats['union_units']}")
 
         # Add to games index
         games_index["games"].append({
             "id": game_id,
-            "name": game["name"],
+            "name": game_name,
             "file": f"{game_id}.json",
         })
 
@@ -245,8 +354,7 @@ def main():
 
     # Write games index
     games_index_path = web_data_dir / "games.json"
-    with open(games_index_path, "w") as f:
-        json.dump(games_index, f, indent=2)
+    write_json(games_index_path, games_index)
     print(f"\nWrote games index to {games_index_path}")
 
 
@@ -28,6 +28,11 @@ load_dotenv()
 # Directory containing this script's parent (the parser directory)
 PARSER_DIR = Path(__file__).parent.parent
 
+# Scenario header line: captures scenario number and name after the colon
+SCENARIO_HEADER_PATTERN = re.compile(r'scenario\s+(\d+):\s*(.+?)(?:\s{2,}|$)', re.IGNORECASE)
+# Multiple dots = TOC entry, e.g. "Scenario 1: The Warwick Line .......4"
+TOC_DOTS_PATTERN = re.compile(r'\.{2,}')
+
 
 @dataclass
 class RawTableRow:
@@ -258,8 +263,6 @@ class RawTableExtractor:
     
     def _find_scenario_pages(self, pdf) -> list[tuple[int, int, str]]:
         """Find all scenario header pages. Returns [(page_num, scenario_num, name), ...]"""
-        # Pattern to capture scenario number and name after the colon
-        scenario_pattern = re.compile(r'scenario\s+(\d+):\s*(.+?)(?:\s{2,}|$)', re.IGNORECASE)
         known_names = self.SCENARIO_NAMES.get(self.game_id, {})
         
         results = []
@@ -275,13 +278,17 @@ class RawTableExtractor:
             text_lower = text.lower()
             if 'table of contents' in text_lower:
                 continue
+            
+            # Most pages never mention a scenario; skip the per-line regex
+            if 'scenario' not in text_lower:
+                continue
                 
             for line in text.split('\n'):
-                match = scenario_pattern.search(line)
+                match = SCENARIO_HEADER_PATTERN.search(line)
                 if match:
                     # Skip TOC-style lines that have dots or page numbers after scenario name
                     # e.g., "Scenario 1: The Warwick Line .......4"
-                    if re.search(r'\.{2,}', line):  # Multiple dots = TOC entry
+                    if TOC_DOTS_PATTERN.search(line):  # Multiple dots = TOC entry
                         continue
                     
                     scenario_num = int(match.group(1))
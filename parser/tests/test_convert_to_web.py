@@ -0,0 +1,195 @@
+"""
+Tests for convert_to_web.py
+
+Run with: cd parser && uv run pytest tests/test_convert_to_web.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add parser directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from pipeline import convert_to_web
+from pipeline.convert_to_web import (
+    convert_unit,
+    convert_gunboat,
+    convert_scenario,
+    dumps_json,
+    is_gunboat,
+    iter_scenarios,
+    write_game_stream,
+    write_json,
+)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+def make_unit(name: str, **overrides) -> dict:
+    """Build a parser-format unit dict."""
+    unit = {
+        "unit_leader": name,
+        "size": "Brig",
+        "command": "L",
+        "unit_type": "Inf",
+        "manpower_value": "4",
+        "hex_location": "S1234",
+        "side": "Confederate",
+        "notes": [],
+        "turn": None,
+        "reinforcement_set": None,
+        "table_name": None,
+    }
+    unit.update(overrides)
+    return unit
+
+
+@pytest.fixture
+def scenario():
+    """Parser-format scenario with regular units and gunboats on both sides."""
+    return {
+        "number": 1,
+        "name": "Test Scenario",
+        "confederate_units": [
+            make_unit("Kershaw"),
+            make_unit("Gunboat", unit_type="Special", hex_location="James River"),
+            make_unit("Semmes"),
+        ],
+        "union_units": [
+            make_unit("(Gunboat)", side="Union", unit_type="Special", hex_location="York River"),
+            make_unit("Meagher", side="Union", reinforcement_set="2"),
+        ],
+        "confederate_footnotes": {"*": "Fatigue Level 1"},
+        "union_footnotes": {},
+    }
+
+
+# ============================================================================
+# Unit Conversion Tests
+# ============================================================================
+
+class TestConvertUnit:
+    """Tests for unit conversion to web format."""
+
+    def test_renames_fields(self):
+        """Parser keys are mapped to camelCase web keys in order."""
+        result = convert_unit(make_unit("Kershaw", notes=["*"]))
+        assert result == {
+            "name": "Kershaw",
+            "size": "Brig",
+            "command": "L",
+            "type": "Inf",
+            "manpowerValue": "4",
+            "hexLocation": "S1234",
+            "notes": ["*"],
+        }
+        assert list(result) == [
+            "name", "size", "command", "type", "manpowerValue", "hexLocation", "notes",
+        ]
+
+    def test_optional_fields_included_when_set(self):
+        """Reinforcement set and table name are only emitted when present."""
+        result = convert_unit(make_unit("Kershaw", reinforcement_set="3", table_name="Reinforcements"))
+        assert result["reinforcementSet"] == "3"
+        assert result["tableName"] == "Reinforcements"
+
+    def test_optional_fields_omitted_when_empty(self):
+        result = convert_unit(make_unit("Kershaw", table_name=""))
+        assert "reinforcementSet" not in result
+        assert "tableName" not in result
+
+
+class TestGunboats:
+    """Tests for gunboat detection and conversion."""
+
+    @pytest.mark.parametrize("name,expected", [
+        ("Gunboat", True),
+        ("Gunboat-1", True),
+        ("(Gunboat)", True),
+        ("Gunboats Wagon", True),
+        ("Naval Battery", False),
+        ("Kershaw", False),
+    ])
+    def test_is_gunboat(self, name, expected):
+        assert is_gunboat({"unit_leader": name}) is expected
+
+    def test_is_gunboat_missing_name(self):
+        assert is_gunboat({}) is False
+
+    def test_convert_gunboat(self):
+        result = convert_gunboat(make_unit("Gunboat", hex_location="James River"))
+        assert result == {"name": "Gunboat", "location": "James River"}
+
+
+# ============================================================================
+# Scenario / Game Conversion Tests
+# ============================================================================
+
+class TestConvertScenario:
+    """Tests for scenario conversion."""
+
+    def test_partitions_gunboats(self, scenario):
+        result = convert_scenario(scenario)
+        assert [u["name"] for u in result["confederateUnits"]] == ["Kershaw", "Semmes"]
+        assert [u["name"] for u in result["unionUnits"]] == ["Meagher"]
+        assert result["confederateGunboats"] == [{"name": "Gunboat", "location": "James River"}]
+        assert result["unionGunboats"] == [{"name": "(Gunboat)", "location": "York River"}]
+
+    def test_metadata(self, scenario):
+        result = convert_scenario(scenario)
+        assert result["number"] == 1
+        assert result["name"] == "Test Scenario"
+        assert result["confederateFootnotes"] == {"*": "Fatigue Level 1"}
+        assert result["unionFootnotes"] == {}
+
+    def test_missing_footnotes_default_to_empty(self, scenario):
+        del scenario["confederate_footnotes"]
+        del scenario["union_footnotes"]
+        result = convert_scenario(scenario)
+        assert result["confederateFootnotes"] == {}
+        assert result["unionFootnotes"] == {}
+
+
+# ============================================================================
+# Streaming Output Tests
+# ============================================================================
+
+class TestStreaming:
+    """Tests for streaming conversion matching the in-memory output."""
+
+    @pytest.mark.parametrize("count", [0, 1, 3])
+    def test_stream_matches_batch(self, tmp_path, scenario, count):
+        scenarios = [convert_scenario(scenario) for _ in range(count)]
+        streamed = tmp_path / "streamed.json"
+        batched = tmp_path / "batched.json"
+        write_game_stream(streamed, "otr2", "On To Richmond!", iter(scenarios))
+        write_json(batched, {"id": "otr2", "name": "On To Richmond!", "scenarios": scenarios})
+        assert streamed.read_bytes() == batched.read_bytes()
+
+    def test_failed_stream_keeps_previous_file(self, tmp_path, scenario):
+        path = tmp_path / "otr2.json"
+        path.write_bytes(b"previous")
+
+        def scenarios():
+            yield convert_scenario(scenario)
+            raise KeyError("confederate_units")
+
+        with pytest.raises(KeyError):
+            write_game_stream(path, "otr2", "On To Richmond!", scenarios())
+        assert path.read_bytes() == b"previous"
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_iter_scenarios(self, tmp_path, scenario):
+        path = tmp_path / "parsed.json"
+        write_json(path, [scenario, scenario])
+        assert list(iter_scenarios(path)) == [scenario, scenario]
+
+    def test_json_fallback_matches_orjson(self, monkeypatch):
+        pytest.importorskip("orjson")
+        data = {"name": "D’Utassy", "hex": "N0605 (Fort Stedman)", "value": [1, 2.5, None]}
+        fast = dumps_json(data)
+        monkeypatch.setattr(convert_to_web, "HAS_ORJSON", False)
+        assert dumps_json(data) == fast
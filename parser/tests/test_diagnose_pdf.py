@@ -0,0 +1,68 @@
+"""
+Tests for diagnose_pdf.py
+
+Run with: cd parser && uv run pytest tests/test_diagnose_pdf.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add utils directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
+
+import pytest
+from diagnose_pdf import analyze_row
+
+
+# ============================================================================
+# Row Parsing Tests
+# ============================================================================
+
+class TestAnalyzeRow:
+    """Unit rows from the raw set-up tables: Name... Size Command Type Manpower [Hex...]"""
+
+    @pytest.mark.parametrize("line,name,size,command,utype,manpower,hex_loc", [
+        ("Stuart Corps Cav Ldr - S1625", "Stuart", "Corps", "Cav", "Ldr", "-", "S1625"),
+        ("Pope Army AV Ldr - S1418 (Culpeper)", "Pope", "Army", "AV", "Ldr", "-", "S1418 (Culpeper)"),
+        ("Featherston-A Brig L Inf 6+ E2632 (Withers)", "Featherston-A", "Brig", "L", "Inf", "6+", "E2632 (Withers)"),
+        ("Armstrong Brig J-Cav Cav 2 5027 (Wilkerson’s Crossroads)",
+         "Armstrong", "Brig", "J-Cav", "Cav", "2", "5027 (Wilkerson’s Crossroads)"),
+        ("Wright Div VI Inf 9* S5211", "Wright", "Div", "VI", "Inf", "9*", "S5211"),
+        ("Wright Div VI Inf 9* S5211\t(Fort  Stedman)", "Wright", "Div", "VI", "Inf", "9*", "S5211 (Fort Stedman)"),
+        ("Wagon Train Demi-Div ANV Inf 1", "Wagon Train", "Demi-Div", "ANV", "Inf", "1", ""),
+        ("  D.R. Jones  Div L Inf 5   N2914  ", "D.R. Jones", "Div", "L", "Inf", "5", "N2914"),
+    ])
+    def test_fields(self, line, name, size, command, utype, manpower, hex_loc):
+        row = analyze_row(line)
+        assert row is not None
+        assert (row["name"], row["size"], row["command"], row["type"], row["manpower"], row["hex"]) == (
+            name, size, command, utype, manpower, hex_loc
+        )
+        assert row["columns_before_size"] == len(name.split())
+        assert row["raw"] == line
+
+    def test_size_is_first_size_token(self):
+        """A size word later in the row (e.g. in the hex text) does not move the Size column."""
+        row = analyze_row("Lee Army ANV Ldr - N2914 (Div HQ)")
+        assert row["name"] == "Lee"
+        assert row["hex"] == "N2914 (Div HQ)"
+
+    @pytest.mark.parametrize("line,trailing", [
+        ("Kershaw 2 Brig L Inf 4 S1234", True),
+        ("Kershaw Brig L Inf 4 S1234", False),
+        ("1 NY Regt V Cav 1 N1234", False),
+    ])
+    def test_trailing_number(self, line, trailing):
+        assert analyze_row(line)["has_trailing_number"] is trailing
+
+    @pytest.mark.parametrize("line", [
+        "",
+        "Confederate Set-up",
+        "Unit/Leader Size Command Type Manpower Hex",
+        "Kershaw Brig L Gun 4 S1234",  # Unknown type
+        "Kershaw Platoon L Inf 4 S1234",  # Unknown size
+        "Brig L Inf 4",  # Fewer than five columns
+        "Kershaw Brig L Inf",  # No manpower
+    ])
+    def test_rejected(self, line):
+        assert analyze_row(line) is None
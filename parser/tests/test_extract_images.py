@@ -0,0 +1,124 @@
+"""
+Tests for extract_images.py
+
+Run with: cd parser && uv run pytest tests/test_extract_images.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# Add image_extraction directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "image_extraction"))
+
+import pytest
+from extract_images import HCRExtractor, RTG2Extractor, _count_leading_initials
+
+
+# ============================================================================
+# Name Normalization Tests
+# ============================================================================
+
+class TestRTG2NormalizeUnitName:
+    """Parsed unit names -> VASSAL image name stems for RTG2-style games."""
+
+    @pytest.mark.parametrize("name,expected", [
+        # Periods removed, spaces and slashes hyphenated
+        ("F. Lee", "F-Lee"),
+        ("A. Jenkins", "A-Jenkins"),
+        ("M.Jenkins", "MJenkins"),
+        ("JI Gregg", "JI-Gregg"),
+        ("1 NY/12 PA", "1-NY-12-PA"),
+        ("Pleasonton", "Pleasonton"),
+        ("", ""),
+        # Artillery reserves
+        ("Art Res-1", "Art1"),
+        ("Art Res-3", "Art3"),
+        ("Art. Res-2", "Art2"),
+        ("Art/Res-1", "Art-Res-1"),
+        # Wagon trains have no image
+        ("Wagon Train", None),
+        ("wagon train", None),
+        ("Wagon-Train", "Wagon-Train"),
+    ])
+    def test_normalize(self, name, expected):
+        assert RTG2Extractor.normalize_unit_name(name) == expected
+
+
+# ============================================================================
+# Alternate Name Tests
+# ============================================================================
+
+class TestAlternateNames:
+    """Alternate spellings tried after the plain normalized name."""
+
+    @pytest.mark.parametrize("name,expected", [
+        ("DM Gregg", ("DM-Gregg", "DMGregg", "DM_Gregg", "DM-Greg", "Gregg", "Greg")),
+        ("J-Smith", ("J-Smith", "JSmith", "J_Smith", "Smith")),
+        ("A.P. Hill", ("AP-Hill", "APHill", "AP_Hill")),
+        ("Wagon Train", ()),
+    ])
+    def test_rtg2(self, name, expected):
+        assert RTG2Extractor.get_alternate_names(name) == expected
+
+    @pytest.mark.parametrize("name,expected", [
+        ("D.R. Jones", ("DR Jones", "dr jones", "Dr jones", "DRJones", "drjones",
+                        "R. Jones", "R. jones", "Jones")),
+        ("D.H. Hill-A", ("DH Hill-A", "dh hill-a", "Dh hill-a", "DHHill-A", "dhhill-a",
+                         "dh hill_a", "H. Hill-A", "H. hill-a", "Hill-A", "Hill-a")),
+        ("J-Smith", ("J-Smith", "j-smith", "J-smith", "j_smith")),
+    ])
+    def test_hcr(self, name, expected):
+        assert HCRExtractor.get_alternate_names(name) == expected
+
+    def test_cached_per_name(self):
+        first = RTG2Extractor.get_alternate_names("F. Lee")
+        hits = RTG2Extractor.get_alternate_names.cache_info().hits
+        assert RTG2Extractor.get_alternate_names("F. Lee") is first
+        assert RTG2Extractor.get_alternate_names.cache_info().hits == hits + 1
+
+    @pytest.mark.parametrize("name,expected", [
+        ("Hood", 0),
+        ("A. Jenkins", 1),
+        ("D.H. Hill", 2),
+        ("A.B.C. Smith", 3),
+        ("a.b. Hill", 0),
+        ("AB. Hill", 0),
+    ])
+    def test_count_leading_initials(self, name, expected):
+        assert _count_leading_initials(name) == expected
+
+
+# ============================================================================
+# Image Match Tests
+# ============================================================================
+
+class TestFindImageMatch:
+    """Matching parsed units against the set of available image names."""
+
+    def test_rtg2_fast_path(self):
+        extractor = RTG2Extractor()
+        assert extractor.find_image_match("F. Lee", "Confederate", "Cav", {"C_F-Lee", "C_FLee"}) == "C_F-Lee"
+
+    def test_rtg2_alternate(self):
+        extractor = RTG2Extractor()
+        assert extractor.find_image_match("F. Lee", "Confederate", "Cav", {"C_FLee"}) == "C_FLee"
+
+    def test_rtg2_leader_initials_stripped(self):
+        extractor = RTG2Extractor()
+        assert extractor.find_image_match("DM Gregg", "Union", "Ldr", {"UL_Greg", "U_DM-Gregg"}) == "UL_Greg"
+
+    def test_rtg2_leader_command_suffix(self):
+        extractor = RTG2Extractor()
+        assert extractor.find_image_match("Meade", "Union", "Ldr", {"UL_MeadeAP"}) == "UL_MeadeAP"
+
+    def test_rtg2_no_image_expected(self):
+        extractor = RTG2Extractor()
+        assert extractor.find_image_match("Wagon Train", "Union", "Inf", {"U_Wagon-Train"}) is None
+
+    def test_hcr_fast_path(self):
+        extractor = HCRExtractor()
+        assert extractor.find_image_match("Hood", "Confederate", "Inf", {"Hood", "hood"}) == "Hood"
+
+    def test_hcr_initials_split(self):
+        extractor = HCRExtractor()
+        assert extractor.find_image_match("D.R. Jones", "Confederate", "Inf", {"Jones"}) == "Jones"
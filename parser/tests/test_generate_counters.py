@@ -0,0 +1,277 @@
+"""
+Tests for generate_counters.py
+
+Run with: cd parser && uv run pytest tests/test_generate_counters.py -v
+"""
+
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+# Add image_extraction directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "image_extraction"))
+
+import pytest
+from generate_counters import (
+    HAS_RAPIDFUZZ,
+    _build_vassal_lookup,
+    _canon,
+    _find_vassal_info,
+    _fuzzy_key,
+    aga_get_name_variants,
+    base_get_name_variants,
+    gtc2_extract_unit_mappings,
+    gtc2_get_name_variants,
+    run_counter_generation,
+    hcr_extract_unit_mappings,
+    hcr_get_name_variants,
+    tpc_extract_unit_mappings,
+    tpc_get_name_variants,
+)
+
+
+# ============================================================================
+# Fixtures
+# ============================================================================
+
+def write_buildfile(tmp_path: Path, slots: list[tuple[str, str, str]]) -> Path:
+    """Write a minimal buildFile.xml with one PieceSlot per (entry, image, prototype)."""
+    lines = [
+        f'<VASSAL.build.widget.PieceSlot entryName="{entry}" gpid="1" height="75" width="75">'
+        f'+/null/prototype;{prototype}\tpiece;;;{image};{entry}/\t\\\tnull;0;0;;0'
+        f'</VASSAL.build.widget.PieceSlot>'
+        for entry, image, prototype in slots
+    ]
+    path = tmp_path / "buildFile.xml"
+    path.write_text("<root>\n" + "\n".join(lines) + "\n</root>")
+    return path
+
+
+def leader_side(extract, tmp_path: Path, entry: str, image: str, prototype: str = "Leader") -> str | None:
+    """Run an extractor over a single leader slot and report which side it landed on."""
+    leaders = extract(write_buildfile(tmp_path, [(entry, image, prototype)]))["Leaders"]
+    for side in ("Union", "Confederate"):
+        if entry in leaders[side]:
+            return side
+    return None
+
+
+# ============================================================================
+# Leader Side Tests
+# ============================================================================
+
+class TestLeaderSides:
+    """Leader entries are assigned to a side by substring match on the entry name."""
+
+    @pytest.mark.parametrize("entry,image,expected", [
+        # Entry names as they appear in the GTC2 buildFile
+        ("Grant-A", "UL-Grant-A.jpg", "Union"),
+        ("Kautz (A)", "UL-Kautz(A).jpg", "Union"),
+        ("DMGregg", "UL-DMGregg.jpg", "Union"),
+        ("Lee-A", "CL-Lee-A.jpg", "Confederate"),
+        ("B R Johnson", "CL-BRJohnson.jpg", "Confederate"),
+        ("Hampton@", "CL-Hampton@.jpg", "Confederate"),
+        # Glued names still contain the leader
+        ("HancockII", "UL-HancockII.jpg", "Union"),
+        ("Lee_ANV", "UL-Lee_ANV.jpg", "Confederate"),
+    ])
+    def test_gtc2(self, tmp_path, entry, image, expected):
+        assert leader_side(gtc2_extract_unit_mappings, tmp_path, entry, image) == expected
+
+    @pytest.mark.parametrize("entry,image,expected", [
+        ("Burnside-A-A", "Burnside-A-A.jpg", "Union"),
+        ("Cox-A", "Cox-A.jpg", "Union"),
+        ("McClellan", "McClellan.jpg", "Union"),
+        ("Jackson", "Jackson.jpg", "Confederate"),
+        ("Stuart", "Stuart.jpg", "Confederate"),
+        ("HookerI", "HookerI.jpg", "Union"),
+        ("Lee_ANV", "Lee_ANV.jpg", "Confederate"),
+    ])
+    def test_hcr(self, tmp_path, entry, image, expected):
+        assert leader_side(hcr_extract_unit_mappings, tmp_path, entry, image) == expected
+
+    def test_hcr_unknown_leader_dropped(self, tmp_path):
+        assert leader_side(hcr_extract_unit_mappings, tmp_path, "Nobody", "Nobody.jpg") is None
+
+    @pytest.mark.parametrize("entry,image,expected", [
+        # The TPC module uses CL- images for many Union leaders
+        ("Meade", "CL-Meade.jpg", "Union"),
+        ("Humphreys-B 12", "CL-Humphreys-B12.jpg", "Union"),
+        ("DM Gregg II", "UL-DMGreggII.jpg", "Union"),
+        ("Warren-B@", "UL-Warren-B@.jpg", "Union"),
+        ("Lee II", "CL-LeeII.jpg", "Confederate"),
+        ("WH-Lee", "CL-WH-Lee.jpg", "Confederate"),
+        ("HancockII", "CL-HancockII.jpg", "Union"),
+        ("Lee_ANV", "UL-Lee_ANV.jpg", "Confederate"),
+    ])
+    def test_tpc(self, tmp_path, entry, image, expected):
+        assert leader_side(tpc_extract_unit_mappings, tmp_path, entry, image) == expected
+
+    @pytest.mark.parametrize("entry,image,expected", [
+        ("Lee", "UL-Lee.jpg", "Confederate"),
+        ("Nobody", "UL-Nobody.jpg", "Union"),
+        ("Nobody", "CL-Nobody.jpg", "Confederate"),
+    ])
+    def test_tpc_name_before_image_prefix(self, tmp_path, entry, image, expected):
+        """Known names win over the image prefix; unknown names fall back to it."""
+        assert leader_side(tpc_extract_unit_mappings, tmp_path, entry, image) == expected
+
+
+# ============================================================================
+# Lookup Tests
+# ============================================================================
+
+def only_name(name: str) -> tuple[str, ...]:
+    """Variant function that adds no variants, to isolate exact vs canonical keys."""
+    return (name,)
+
+
+def make_mappings(union=None, confederate=None, union_leaders=None, confederate_leaders=None) -> dict:
+    """Build an extract_unit_mappings-style result."""
+    return {
+        "Union": {name: {"image": image, "type": "Unit"} for name, image in (union or {}).items()},
+        "Confederate": {name: {"image": image, "type": "Unit"} for name, image in (confederate or {}).items()},
+        "Leaders": {"Union": union_leaders or {}, "Confederate": confederate_leaders or {}},
+    }
+
+
+def match(mappings: dict, name: str, side: str = "Confederate", variants=only_name):
+    info = _find_vassal_info(name, variants, *_build_vassal_lookup(mappings, variants)[side])
+    if info is None:
+        return None
+    return info["image"] if isinstance(info, dict) else info
+
+
+class TestLookups:
+    """Exact variant keys come first; canonical keys are only a fallback."""
+
+    @pytest.mark.parametrize("name,expected", [
+        ("A.P. Hill", "aphill"),
+        ("Breckinridge@", "breckinridge"),
+        ("D’Utassy", "dutassy"),
+        ("10/37 Clrd", "1037clrd"),
+    ])
+    def test_canon(self, name, expected):
+        assert _canon(name) == expected
+
+    def test_exact_beats_canonical(self):
+        mappings = make_mappings(union={"Kenly-B": "U_Kenly-B.jpg", "Kenly B": "U_Kenly_B.jpg"})
+        assert match(mappings, "Kenly B", side="Union") == "U_Kenly_B.jpg"
+        assert match(mappings, "Kenly-B", side="Union") == "U_Kenly-B.jpg"
+
+    def test_canonical_fallback(self):
+        mappings = make_mappings(confederate={"A.P. Hill": "C_APHill.jpg"})
+        assert match(mappings, "AP Hill") == "C_APHill.jpg"
+
+    def test_no_match(self):
+        assert match(make_mappings(confederate={"Hood": "C_Hood.jpg"}), "Pickett") is None
+
+    def test_unit_wins_collision_with_leader(self):
+        mappings = make_mappings(
+            confederate={"Breckinridge": "C_Breckinridge.jpg"},
+            confederate_leaders={"Breckinridge": "CL_Breckinridge.jpg"},
+        )
+        assert match(mappings, "Breckinridge") == "C_Breckinridge.jpg"
+        assert match(mappings, "Breckinridge@") == "C_Breckinridge.jpg"
+
+    def test_leader_found(self):
+        mappings = make_mappings(confederate_leaders={"Hood": "CL_Hood.jpg"})
+        assert match(mappings, "Hood") == "CL_Hood.jpg"
+
+    def test_name_variants_used_before_canonical(self):
+        mappings = make_mappings(confederate={"Hood-A": "C_Hood-A.jpg", "HoodA": "C_HoodA.jpg"})
+        assert match(mappings, "Hood - A", variants=base_get_name_variants) == "C_Hood-A.jpg"
+
+
+# ============================================================================
+# Name Variant Tests
+# ============================================================================
+
+class TestNameVariants:
+    """Variant lists always start with the name itself and cover known VASSAL spellings."""
+
+    @pytest.mark.parametrize("name,expected", [
+        ("Hood-A", ("Hood-A", "Hood - A", "Hood", "Hood A")),
+        ("Hood - A", ("Hood - A", "Hood-A")),
+        ("Pickett", ("Pickett",)),
+    ])
+    def test_base(self, name, expected):
+        assert base_get_name_variants(name) == expected
+
+    @pytest.mark.parametrize("get_variants,name,expected", [
+        (gtc2_get_name_variants, "WH Lee", {"WHLee", "WH-Lee", "W H Lee"}),
+        (gtc2_get_name_variants, "Kautz (A)", {"Kautz-A"}),
+        (hcr_get_name_variants, "A.P.Hill", {"A. P. Hill", "A.P.Hill-A"}),
+        (tpc_get_name_variants, "Birney II", {"Birney-II", "Birney - II"}),
+        (tpc_get_name_variants, "10/37 Clrd", {"10 / 37 Clrd", "10/37 Colored"}),
+    ])
+    def test_spellings(self, get_variants, name, expected):
+        variants = get_variants(name)
+        assert variants[0] == name
+        assert expected <= set(variants)
+        assert len(variants) == len(set(variants))
+
+    @pytest.mark.parametrize("get_variants,name,swapped", [
+        (gtc2_get_name_variants, "Wilcox", "Willcox"),
+        (gtc2_get_name_variants, "Willcox", "Wilcox"),
+        (gtc2_get_name_variants, "Tobert", "Torbert"),
+        (gtc2_get_name_variants, "Schoonmkr", "Schoonmaker"),
+        (hcr_get_name_variants, "Heitz", "Heintz"),
+        (hcr_get_name_variants, "D’Utassy", "D'Utassy"),
+        (hcr_get_name_variants, "D'Utassy", "D’Utassy"),
+        (tpc_get_name_variants, "Torber", "Torbert"),
+        (aga_get_name_variants, "Heintzelman", "Heintzlmn"),
+    ])
+    def test_typo_swaps(self, get_variants, name, swapped):
+        assert swapped in get_variants(name)
+
+
+# ============================================================================
+# Fuzzy Fallback Tests
+# ============================================================================
+
+class TestFuzzyKey:
+    """Edit-distance fallback over canonical keys."""
+
+    def test_empty_key(self):
+        assert _fuzzy_key("", ["hood"]) is None
+
+    @pytest.mark.skipif(not HAS_RAPIDFUZZ, reason="rapidfuzz not installed")
+    def test_close_match(self):
+        assert _fuzzy_key("rickets", ["ricketts", "hood"]) == "ricketts"
+
+    @pytest.mark.skipif(not HAS_RAPIDFUZZ, reason="rapidfuzz not installed")
+    def test_lettered_variants_not_swapped(self):
+        assert _fuzzy_key("rickettsa", ["rickettsb"]) is None
+
+    @pytest.mark.skipif(not HAS_RAPIDFUZZ, reason="rapidfuzz not installed")
+    def test_below_cutoff(self):
+        assert _fuzzy_key("hood", ["pickett"]) is None
+
+    @pytest.mark.skipif(not HAS_RAPIDFUZZ, reason="rapidfuzz not installed")
+    def test_abbreviations_need_typo_swaps(self):
+        """Heavy abbreviations fall below the cutoff, hence the swap tables."""
+        assert _fuzzy_key("schoonmaker", ["schoonmkr"]) is None
+
+
+# ============================================================================
+# Module Source Tests
+# ============================================================================
+
+class TestVmodCleanup:
+    """The scratch directory for a .vmod source is removed even when the run fails."""
+
+    def test_scratch_removed_on_error(self, tmp_path, monkeypatch):
+        scratch = tmp_path / "scratch"
+        scratch.mkdir()
+        monkeypatch.setattr(tempfile, "tempdir", str(scratch))
+
+        # No images/ directory, so the run stops with a ValueError after extraction
+        vmod = tmp_path / "broken.vmod"
+        with zipfile.ZipFile(vmod, "w") as zf:
+            zf.writestr("buildFile.xml", "<root/>")
+
+        with pytest.raises(ValueError, match="images directory not found"):
+            run_counter_generation("hcr", vmod, output_dir=tmp_path / "out")
+        assert list(scratch.iterdir()) == []
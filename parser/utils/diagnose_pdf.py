@@ -16,8 +16,14 @@ import sys
 from collections import Counter
 
 
-VALID_SIZES = ['Army', 'Corps', 'Demi-Div', 'D-Div', 'Div', 'Brig', 'Regt']
-VALID_TYPES = ['Ldr', 'Inf', 'Cav', 'Art']
+VALID_SIZES = frozenset(('Army', 'Corps', 'Demi-Div', 'D-Div', 'Div', 'Brig', 'Regt'))
+VALID_TYPES = frozenset(('Ldr', 'Inf', 'Cav', 'Art'))
+
+# Words that legitimately make a unit name multi-word (Wagon Train, Naval Battery, ...)
+MULTI_WORD_NAME_PARTS = frozenset(('Wagon', 'Naval', 'Light'))
+
+# Shortest section/header marker matched in diagnose_page ('unit/leader')
+MIN_MARKER_LEN = len('unit/leader')
 
 # Page ranges for games that share a PDF (1-indexed, inclusive)
 # Imported from scenario_parser.py logic
@@ -28,86 +34,87 @@ PAGE_RANGES = {
 }
 
 
-def find_size_index(parts: list[str]) -> int | None:
-    """Find the index of the Size column in a row."""
-    for i, part in enumerate(parts):
-        if part in VALID_SIZES or part == 'D-Div':
-            return i
-    return None
+def _alternation(words) -> str:
+    return '|'.join(re.escape(w) for w in sorted(words))
+
+
+# Unit row: Name... Size Command Type Manpower [Hex...]
+# Name tokens may not be sizes, so Size is always the first size token in the row.
+ROW_PATTERN = re.compile(
+    rf'^\s*(?P<name>(?:(?!(?:{_alternation(VALID_SIZES)})\s)\S+\s+)*)'
+    rf'(?P<size>{_alternation(VALID_SIZES)})\s+'
+    rf'(?P<command>\S+)\s+'
+    rf'(?P<type>{_alternation(VALID_TYPES)})\s+'
+    rf'(?P<manpower>\S+)'
+    rf'(?:\s+(?P<hex>.*?))?\s*$'
+)
 
 
 def analyze_row(line: str) -> dict | None:
     """Analyze a potential unit row and return parsed fields."""
-    parts = line.split()
-    if len(parts) < 5:
+    match = ROW_PATTERN.match(line)
+    if not match:
         return None
     
-    size_idx = find_size_index(parts)
-    if size_idx is None:
+    name_parts = match['name'].split()
+    hex_loc = ' '.join(match['hex'].split()) if match['hex'] else ''
+    # Rows need at least five columns
+    if not name_parts and not hex_loc:
         return None
     
     # Check if there's a suspicious standalone number before Size
-    name_parts = parts[:size_idx]
-    has_trailing_number = bool(name_parts and re.match(r'^\d+$', name_parts[-1]))
-    
-    remaining = parts[size_idx + 1:]
-    if len(remaining) < 3:
-        return None
-    
-    # Check if unit type is valid
-    unit_type = remaining[1] if len(remaining) > 1 else None
-    if unit_type not in VALID_TYPES:
-        return None
+    has_trailing_number = bool(name_parts) and name_parts[-1].isdecimal()
     
     return {
         'raw': line,
         'name_parts': name_parts,
         'name': ' '.join(name_parts),
-        'size': parts[size_idx],
-        'command': remaining[0] if remaining else None,
-        'type': unit_type,
-        'manpower': remaining[2] if len(remaining) > 2 else None,
-        'hex': ' '.join(remaining[3:]) if len(remaining) > 3 else '',
+        # Categorical columns take a handful of values; share one string each
+        'size': sys.intern(match['size']),
+        'command': sys.intern(match['command']),
+        'type': sys.intern(match['type']),
+        'manpower': match['manpower'],
+        'hex': hex_loc,
         'has_trailing_number': has_trailing_number,
-        'columns_before_size': size_idx,
+        'columns_before_size': len(name_parts),
     }
 
 
-def diagnose_page(pdf, page_idx: int):
+def diagnose_page(page, page_idx: int):
     """Analyze a single page for unit table structure."""
-    page = pdf.pages[page_idx]
     text = page.extract_text() or ''
     lines = text.split('\n')
     
-    print(f"\n{'='*70}")
-    print(f"PAGE {page_idx + 1}")
-    print('='*70)
+    # Collect the page report and write it once at the end
+    out = [f"\n{'='*70}", f"PAGE {page_idx + 1}", '='*70]
     
     units = []
     in_setup = False
     current_side = None
     
     for line in lines:
-        line_lower = line.lower()
+        # Lines shorter than every marker can only be unit rows
+        line_lower = line.lower() if len(line) >= MIN_MARKER_LEN else ''
         
-        # Track setup sections
-        if 'confederate set-up' in line_lower:
-            current_side = 'Confederate'
-            in_setup = True
-            print(f"\n--- Confederate Set-up ---")
-            continue
-        elif 'union set-up' in line_lower:
-            current_side = 'Union'
-            in_setup = True
-            print(f"\n--- Union Set-up ---")
-            continue
+        # Track setup sections (cheap common check before the side-specific ones)
+        if 'set-up' in line_lower:
+            if 'confederate set-up' in line_lower:
+                current_side = 'Confederate'
+                in_setup = True
+                out.append("\n--- Confederate Set-up ---")
+                continue
+            elif 'union set-up' in line_lower:
+                current_side = 'Union'
+                in_setup = True
+                out.append("\n--- Union Set-up ---")
+                continue
         
         if not in_setup:
             continue
         
         # Skip headers
         if 'unit/leader' in line_lower:
-            print(f"  [HEADER] {line}")
+            out.append(f"  [HEADER] {line}")
             continue
         
         # Try to parse as unit
@@ -123,10 +130,11 @@ def diagnose_page(pdf, page_idx: int):
                 warnings.append(f"⚠️  {result['columns_before_size']} COLUMNS BEFORE SIZE")
             
             warning_str = ' '.join(warnings) if warnings else ''
-            print(f"  {result['name']:20} | {result['size']:8} | {result['command']:6} | {result['type']:4} | {result['manpower']:5} | {result['hex'][:30]}")
+            out.append(f"  {result['name']:20} | {result['size']:8} | {result['command']:6} | {result['type']:4} | {result['manpower']:5} | {result['hex'][:30]}")
             if warning_str:
-                print(f"    {warning_str}")
+                out.append(f"    {warning_str}")
     
+    sys.stdout.write('\n'.join(out) + '\n')
     return units
 
 
@@ -154,53 +162,62 @@ def diagnose_pdf(pdf_path: str, game_id: str | None = None, specific_page: int |
         if end_page is None:
             end_page = len(pdf.pages)
         
-        all_units = []
+        # The summary only needs a few fields, kept as parallel columns
+        names: list[str] = []
+        name_parts_list: list[list[str]] = []
+        trailing_flags: list[bool] = []
+        cols_before: list[int] = []
+        
+        def collect(units: list[dict]):
+            for u in units:
+                names.append(u['name'])
+                name_parts_list.append(u['name_parts'])
+                trailing_flags.append(u['has_trailing_number'])
+                cols_before.append(u['columns_before_size'])
         
         if specific_page:
             # Diagnose specific page
-            all_units = diagnose_page(pdf, start_page)
+            collect(diagnose_page(pdf.pages[start_page], start_page))
         else:
             # Scan pages in range for unit tables
-            for page_idx in range(start_page, min(end_page, len(pdf.pages))):
-                page = pdf.pages[page_idx]
-                text = page.extract_text() or ''
-                
-                # Only process pages with setup tables
-                if 'set-up' in text.lower():
-                    units = diagnose_page(pdf, page_idx)
-                    all_units.extend(units)
+            for page_idx, page in enumerate(pdf.pages[start_page:end_page], start=start_page):
+                # Probe with the cheap line collation; only run the layout-based
+                # extract_text() on pages that mention set-up tables. The probe
+                # text is not reused for rows since the two extractors can
+                # space and order words differently.
+                if 'set-up' in (page.extract_text_simple() or '').lower():
+                    collect(diagnose_page(page, page_idx))
         
         # Summary
         print(f"\n{'='*70}")
         print("SUMMARY")
         print('='*70)
-        print(f"Total units found: {len(all_units)}")
+        print(f"Total units found: {len(names)}")
         
         # Check for column anomalies
-        trailing_numbers = [u for u in all_units if u['has_trailing_number']]
+        trailing_numbers = [i for i, flag in enumerate(trailing_flags) if flag]
         if trailing_numbers:
             print(f"\n⚠️  ANOMALY: {len(trailing_numbers)} units have trailing numbers in name")
             print("   This may indicate an extra column (like 'Set' for reinforcement turns)")
             print("   Examples:")
-            for u in trailing_numbers[:5]:
-                print(f"     '{u['name']}' -> name_parts: {u['name_parts']}")
+            for i in trailing_numbers[:5]:
+                print(f"     '{names[i]}' -> name_parts: {name_parts_list[i]}")
         
         # Check column counts
-        col_counts = Counter(u['columns_before_size'] for u in all_units)
+        col_counts = Counter(cols_before)
         if len(col_counts) > 1:
             print(f"\n⚠️  ANOMALY: Inconsistent columns before Size: {dict(col_counts)}")
         else:
             print(f"\n✓ Consistent columns before Size: {dict(col_counts)}")
         
         # Check for multi-word names (might include extra column)
-        multi_word = [u for u in all_units if len(u['name_parts']) > 1 and not any(
-            p in ['Wagon', 'Naval', 'Light'] for p in u['name_parts']
-        )]
+        multi_word = [names[i] for i, parts in enumerate(name_parts_list)
+                      if len(parts) > 1 and MULTI_WORD_NAME_PARTS.isdisjoint(parts)]
         if multi_word:
             print(f"\n⚠️  INFO: {len(multi_word)} units have multi-word names")
             print("   Verify these aren't picking up extra columns:")
-            for u in multi_word[:5]:
-                print(f"     '{u['name']}'")
+            for name in multi_word[:5]:
+                print(f"     '{name}'")
 
 
 def main():